@@ -203,7 +203,7 @@ async def run_background_verification(req: BackgroundVerifyRequest) -> Backgroun
         logger.info(f"Company evidence gathered for {pos.employer_name}: {len(comp_ev)} sources")
         company_evidence[pos.employer_name] = comp_ev
         logger.info(f"Checking timeline for {pos.employer_name}")
-        timeline_assessment[pos.employer_name] = await _timeline_check_position(pos.dict(), comp_ev)
+        timeline_assessment[pos.employer_name] = await _timeline_check_position(pos.model_dump(), comp_ev)
         logger.info(f"Timeline check completed for {pos.employer_name}")
 
     # Education
@@ -234,7 +234,7 @@ async def run_background_verification(req: BackgroundVerifyRequest) -> Backgroun
     edu_scores: List[float] = []
     for ed in req.educations:
         logger.info(f"Calculating education score for {ed.institution_name}")
-        edu_scores.append(_education_score(education_evidence[ed.institution_name], ed.dict()))
+        edu_scores.append(_education_score(education_evidence[ed.institution_name], ed.model_dump()))
     education_ok = round(sum(edu_scores)/len(edu_scores), 2) if edu_scores else 0.5
     logger.info(f"Education score calculated: {education_ok}")
 
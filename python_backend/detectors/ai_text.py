@@ -5,6 +5,9 @@ AI text detection using Amazon Bedrock.
 import boto3
 import json
 import logging
+import re
+import msgspec
+from functools import cached_property
 from typing import Dict, Any, Optional
 from botocore.exceptions import ClientError
 
@@ -13,6 +16,44 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# The model sometimes wraps its JSON answer in prose; grab the outermost object
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+
+class _BedrockDetection(msgspec.Struct):
+    """The JSON object the detection prompt asks the model to return."""
+    ai_likelihood: float = 0.5
+    rationale: str = 'No rationale provided'
+
+
+# Built once; decodes and type-checks the model's answer in a single pass
+_DETECTION_DECODER = msgspec.json.Decoder(_BedrockDetection)
+
+# Detection prompt, split around the resume text so each call is a plain concatenation
+_DETECTION_PROMPT_PREFIX = """You are a writing forensics assistant. Analyze the following resume content and determine if it was likely AI-generated.
+
+Consider these factors:
+- Repetitiveness and generic phrasing
+- Overuse of power verbs and buzzwords
+- Unnatural consistency in tone
+- Lack of concrete, specific details
+- Overly perfect formatting or structure
+- Generic job descriptions without specific achievements
+- Unusual patterns in language or structure
+
+Resume content:
+"""
+
+_DETECTION_PROMPT_SUFFIX = """
+
+Please respond with ONLY a JSON object in this exact format:
+{
+  "ai_likelihood": 0.75,
+  "rationale": "Brief explanation of your analysis"
+}
+
+Where ai_likelihood is a number between 0 and 1 (0 = definitely human-written, 1 = definitely AI-generated)."""
+
 class AITextDetector:
     """Detector for AI-generated text using Amazon Bedrock."""
     
@@ -22,15 +63,17 @@ class AITextDetector:
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region
         
-        # Initialize Bedrock client
-        self.bedrock_client = boto3.client(
+        self.model_id = "us.anthropic.claude-sonnet-4-20250514-v1:0"
+    
+    @cached_property
+    def bedrock_client(self):
+        """Bedrock runtime client, created on first use (botocore model loading is slow)."""
+        return boto3.client(
             'bedrock-runtime',
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=aws_region
+            aws_access_key_id=self.aws_access_key_id,
+            aws_secret_access_key=self.aws_secret_access_key,
+            region_name=self.aws_region
         )
-        
-        self.model_id = "us.anthropic.claude-sonnet-4-20250514-v1:0"
     
     async def detect_ai_content(self, text: str, model: str = "claude-sonnet-4") -> AiDetectionResult:
         """
@@ -201,27 +244,7 @@ class AITextDetector:
     
     def _create_detection_prompt(self, text: str) -> str:
         """Create the prompt for AI detection."""
-        return f"""You are a writing forensics assistant. Analyze the following resume content and determine if it was likely AI-generated.
-
-Consider these factors:
-- Repetitiveness and generic phrasing
-- Overuse of power verbs and buzzwords
-- Unnatural consistency in tone
-- Lack of concrete, specific details
-- Overly perfect formatting or structure
-- Generic job descriptions without specific achievements
-- Unusual patterns in language or structure
-
-Resume content:
-{text}
-
-Please respond with ONLY a JSON object in this exact format:
-{{
-  "ai_likelihood": 0.75,
-  "rationale": "Brief explanation of your analysis"
-}}
-
-Where ai_likelihood is a number between 0 and 1 (0 = definitely human-written, 1 = definitely AI-generated)."""
+        return _DETECTION_PROMPT_PREFIX + text + _DETECTION_PROMPT_SUFFIX
     
     async def _call_bedrock(self, prompt: str) -> Dict[str, Any]:
         """Call Amazon Bedrock with the given prompt."""
@@ -260,12 +283,11 @@ Where ai_likelihood is a number between 0 and 1 (0 = definitely human-written, 1
             content = response.get('content', [{}])[0].get('text', '{}')
             
             # Extract JSON from response
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', content)
+            json_match = _JSON_OBJECT_RE.search(content)
             if json_match:
-                parsed = json.loads(json_match.group(0))
-                ai_likelihood = parsed.get('ai_likelihood', 0.5)
-                rationale = parsed.get('rationale', 'No rationale provided')
+                parsed = _DETECTION_DECODER.decode(json_match.group(0))
+                ai_likelihood = parsed.ai_likelihood
+                rationale = parsed.rationale
             else:
                 logger.warning("No JSON found in Bedrock response")
                 ai_likelihood = 0.5
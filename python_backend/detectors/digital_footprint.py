@@ -10,6 +10,9 @@ from utils.cached_api_client import cached_api_client
 
 logger = get_logger(__name__)
 
+# Platforms that indicate a professional online presence, in match priority order
+PROFESSIONAL_KEYWORDS = ('linkedin', 'github', 'stackoverflow', 'researchgate', 'scholar')
+
 class DigitalFootprintService:
     """Service for analyzing digital footprint and online presence."""
     
@@ -148,7 +151,6 @@ class DigitalFootprintService:
                     score += 0.1
             
             # Check for professional indicators (more weight)
-            professional_keywords = ['linkedin', 'github', 'stackoverflow', 'researchgate', 'scholar']
             professional_platforms_found = set()
             
             for result in google_results:
@@ -157,7 +159,7 @@ class DigitalFootprintService:
                 link = result.get('link', '').lower()
                 content = f"{title} {snippet} {link}"
                 
-                for keyword in professional_keywords:
+                for keyword in PROFESSIONAL_KEYWORDS:
                     if keyword in content:
                         professional_platforms_found.add(keyword)
                         break
@@ -180,6 +180,9 @@ class FileSecurityScanner:
 
     def _get_file_info(self, file_path: str, file_content: bytes) -> Dict[str, Any]:
         """Get basic file information."""
+        # Computed up front so the error fallback below reports the same digest
+        sha256_hash = hashlib.sha256(file_content).hexdigest()
+        
         try:
             file_name = os.path.basename(file_path)
             file_extension = os.path.splitext(file_name)[1].lower()
@@ -187,9 +190,6 @@ class FileSecurityScanner:
             # Detect MIME type based on file extension and content
             mime_type = self._detect_mime_type(file_content, file_extension)
             
-            # Calculate file hash
-            sha256_hash = hashlib.sha256(file_content).hexdigest()
-            
             return {
                 "name": file_name,
                 "extension": file_extension,
@@ -205,7 +205,7 @@ class FileSecurityScanner:
                 "extension": "",
                 "size": len(file_content),
                 "mime_type": "application/octet-stream",
-                "sha256": hashlib.sha256(file_content).hexdigest(),
+                "sha256": sha256_hash,
                 "scan_time": "unknown"
             }
 
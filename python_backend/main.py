@@ -6,6 +6,7 @@ from fastapi import FastAPI, File, UploadFile, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import asyncio
 import logging
 import time
 from typing import Optional
@@ -28,6 +29,7 @@ from app.contact_verification import router as contact_router
 from app.background_verification import router as background_router
 from app.digital_footprint import router as digital_footprint_router
 from utils.cache import api_cache, analysis_cache
+from utils.rate_limiter import client_rate_limiter, global_rate_limiter
 
 # Setup logging
 setup_logging()
@@ -68,7 +70,12 @@ async def startup_event():
     """Initialize the analyzer on startup."""
     global analyzer
     try:
-        settings = get_settings()
+        # The first load makes blocking SSM calls; do it off the event loop so
+        # every later (cached) get_settings() call is free
+        settings = await asyncio.to_thread(get_settings)
+        # Share cached responses across workers through the configured Redis
+        for cache in (api_cache, analysis_cache):
+            cache.use_redis(settings.redis_url)
         analyzer = ResumeAnalyzer(settings)
         logger.info("Resume analyzer initialized successfully")
     except Exception as e:
@@ -99,6 +106,14 @@ async def cache_stats():
         logger.error(f"Error getting cache stats: {e}")
         raise HTTPException(status_code=500, detail="Failed to get cache statistics")
 
+@app.get("/rate-limit/stats")
+async def rate_limit_stats():
+    """Get rate limiter statistics."""
+    return {
+        "client_rate_limiter": await client_rate_limiter.get_stats(),
+        "global_rate_limiter": await global_rate_limiter.get_stats()
+    }
+
 @app.post("/cache/clear")
 async def clear_cache():
     """Clear all caches."""
@@ -4,7 +4,8 @@ Mirrors the TypeScript types from the Next.js frontend.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic.dataclasses import dataclass
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
@@ -81,10 +82,16 @@ class DigitalFootprintResult(BaseModel):
     consistency_score: int = Field(..., ge=0, le=100)
     details: str
 
-class RiskSlice(BaseModel):
-    """Individual risk assessment slice."""
+@dataclass(slots=True, frozen=True)
+class RiskSlice:
+    """Individual risk assessment slice.
+
+    A slotted pydantic dataclass: fields are validated like a model's, on
+    construction and inside ``AggregatedReport.slices``, without a
+    per-instance ``__dict__``.
+    """
     label: str
-    score: int = Field(..., ge=0, le=100)
+    score: Annotated[int, Field(ge=0, le=100)]
     description: str
 
 class Evidence(BaseModel):
@@ -27,6 +27,19 @@ logger = get_logger(__name__)
 class ResumeAnalyzer:
     """Main analyzer that orchestrates all fraud detection components."""
     
+    # WordprocessingML tags, namespace-qualified once for lxml's iter()
+    DOCX_PARAGRAPH_TAG = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
+    DOCX_TEXT_TAG = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t"
+    # Run content that stands for whitespace rather than carrying w:t text
+    DOCX_WHITESPACE_TAGS = {
+        "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tab": "\t",
+        "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}br": "\n",
+        "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}cr": "\n",
+    }
+    # Legacy copy of an mc:AlternateContent choice (e.g. a VML text box) that
+    # repeats the text of the modern one
+    DOCX_FALLBACK_TAG = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+    
     def __init__(self, settings: Settings):
         """Initialize the resume analyzer."""
         self.settings = settings
@@ -83,11 +96,12 @@ class ResumeAnalyzer:
         try:
             logger.info(f"Starting comprehensive analysis for {filename}")
             
-            # Extract text content
-            extracted_text = await self._extract_text_content(file_content, filename, file_type)
-            
-            # Perform file security scan
-            security_scan = await self.security_scanner.scan_file(filename, file_content)
+            # Extract text content and run the file security scan concurrently;
+            # neither depends on the other
+            extracted_text, security_scan = await asyncio.gather(
+                self._extract_text_content(file_content, filename, file_type),
+                self.security_scanner.scan_file(filename, file_content)
+            )
             
             # Check if file is safe to process
             if not security_scan["is_safe"]:
@@ -259,39 +273,67 @@ class ResumeAnalyzer:
     async def _extract_pdf_text(self, file_content: bytes) -> str:
         """Extract text from PDF."""
         try:
-            import PyPDF2
-            import io
-            
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            
-            return text.strip()
+            return await asyncio.to_thread(self._read_pdf_text, file_content)
         except Exception as e:
             logger.error(f"Error extracting PDF text: {e}")
             return ""
     
+    @staticmethod
+    def _read_pdf_text(file_content: bytes) -> str:
+        """Read every page's text layer with PDFium; blocking, so run off the event loop."""
+        import pypdfium2 as pdfium
+        
+        pdf = pdfium.PdfDocument(file_content)
+        try:
+            text = "\n".join(pdf[i].get_textpage().get_text_range() for i in range(len(pdf)))
+        finally:
+            pdf.close()
+        
+        # PDFium ends lines with CRLF; normalise to match the DOCX path
+        return text.replace("\r\n", "\n").strip()
+    
     async def _extract_docx_text(self, file_content: bytes) -> str:
         """Extract text from DOCX."""
         try:
-            from docx import Document
-            import io
-            
-            doc_file = io.BytesIO(file_content)
-            doc = Document(doc_file)
-            
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            return text.strip()
+            return await asyncio.to_thread(self._read_docx_text, file_content)
         except Exception as e:
             logger.error(f"Error extracting DOCX text: {e}")
             return ""
     
+    @classmethod
+    def _read_docx_text(cls, file_content: bytes) -> str:
+        """Stream paragraph text out of word/document.xml with libxml2; blocking, so run off the event loop."""
+        import io
+        import zipfile
+        from lxml import etree
+        
+        with zipfile.ZipFile(io.BytesIO(file_content)) as archive:
+            xml = archive.read("word/document.xml")
+        
+        parser = etree.XMLParser(resolve_entities=False, no_network=True)
+        root = etree.fromstring(xml, parser)
+        paragraphs = (
+            cls._docx_paragraph_text(paragraph)
+            for paragraph in root.iter(cls.DOCX_PARAGRAPH_TAG)
+            if next(paragraph.iterancestors(cls.DOCX_FALLBACK_TAG), None) is None
+        )
+        return "\n".join(paragraphs).strip()
+    
+    @classmethod
+    def _docx_paragraph_text(cls, paragraph) -> str:
+        """Text of one w:p, leaving nested paragraphs (text boxes) to their own line."""
+        parts = []
+        for child in paragraph:
+            if child.tag in (cls.DOCX_PARAGRAPH_TAG, cls.DOCX_FALLBACK_TAG):
+                continue
+            if child.tag == cls.DOCX_TEXT_TAG:
+                parts.append(child.text or "")
+            elif child.tag in cls.DOCX_WHITESPACE_TAGS:
+                parts.append(cls.DOCX_WHITESPACE_TAGS[child.tag])
+            else:
+                parts.append(cls._docx_paragraph_text(child))
+        return "".join(parts)
+    
     async def _extract_candidate_info(self, text: str, hints: Optional[Dict[str, Any]] = None) -> CandidateInfo:
         """Extract candidate information from text using AI."""
         try:
@@ -456,7 +498,7 @@ Resume text:
             )
             
             # Convert to dictionary for consistency
-            result_dict = result.dict() if hasattr(result, 'dict') else result
+            result_dict = result.model_dump() if hasattr(result, 'model_dump') else result
             logger.info(f"Background verification completed with score: {result_dict.get('score', {}).get('composite', 'unknown')}")
             return result_dict
             
@@ -667,7 +709,7 @@ Resume text:
             logger.info(f"Starting digital footprint analysis for {candidate_info.full_name}")
             
             # Initialize digital footprint service
-            from detectors.digital_footprint import DigitalFootprintService
+            from detectors.digital_footprint import DigitalFootprintService, PROFESSIONAL_KEYWORDS
             from utils.config import get_settings
             
             settings = get_settings()
@@ -680,26 +722,25 @@ Resume text:
                 phone=candidate_info.phone
             )
             
-            # Convert to DigitalFootprintResult format
-            search_results = [r.get('title', '') for r in result.get('google_search', [])]
+            # Convert to DigitalFootprintResult format, pulling each field into
+            # parallel lists so lowercasing runs through map() in one batch
+            items = result.get('google_search', [])
+            titles = [r.get('title', '') for r in items]
+            links = [r.get('link', '') for r in items]
+            snippets = [r.get('snippet', '') for r in items]
+            haystacks = map(str.lower, map('{} {}'.format, titles, links))
+            search_results = titles
             
             # Extract social media presence from search results
             social_presence = {}
-            professional_keywords = ['linkedin', 'github', 'stackoverflow', 'researchgate', 'scholar']
-            
-            for result_item in result.get('google_search', []):
-                title = result_item.get('title', '').lower()
-                link = result_item.get('link', '').lower()
-                snippet = result_item.get('snippet', '').lower()
-                
-                for keyword in professional_keywords:
-                    if keyword in title or keyword in link:
-                        if keyword not in social_presence:
-                            social_presence[keyword] = []
-                        social_presence[keyword].append({
-                            'title': result_item.get('title', ''),
-                            'link': result_item.get('link', ''),
-                            'snippet': result_item.get('snippet', '')
+            
+            for title, link, snippet, haystack in zip(titles, links, snippets, haystacks):
+                for keyword in PROFESSIONAL_KEYWORDS:
+                    if keyword in haystack:
+                        social_presence.setdefault(keyword, []).append({
+                            'title': title,
+                            'link': link,
+                            'snippet': snippet
                         })
                         break
             
@@ -850,8 +891,8 @@ Resume text:
         rationale = [
             f"AI Content: {'High risk' if ai_detection.is_ai_generated else 'Low risk'} ({ai_detection.confidence}% confidence)",
             f"Document Authenticity: {document_authenticity.authenticityScore}% authentic",
-            f"Contact Verification: {contact_verification.get('score', {}).get('composite', 0) * 100:.0f}% score" if contact_verification else "Contact Verification: Not performed",
-            f"Background Verification: {background_verification.get('score', {}).get('composite', 0) * 100:.0f}% score" if background_verification else "Background Verification: Not performed"
+            f"Contact Verification: {contact_score}% score" if contact_verification else "Contact Verification: Not performed",
+            f"Background Verification: {background_score}% score" if background_verification else "Background Verification: Not performed"
         ]
         
         return AggregatedReport(
@@ -3,6 +3,7 @@ Supabase client for data persistence.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from supabase import create_client, Client
 from models.schemas import AggregatedReport, CandidateInfo
@@ -10,12 +11,19 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=8)
+def _get_client(supabase_url: str, supabase_key: str) -> Client:
+    """Return a shared Supabase client so connections are reused across instances."""
+    return create_client(supabase_url, supabase_key)
+
+
 class SupabaseStorage:
     """Supabase storage client for persisting analysis results."""
     
     def __init__(self, supabase_url: str, supabase_key: str):
         """Initialize Supabase client."""
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.supabase: Client = _get_client(supabase_url, supabase_key)
     
     async def save_analysis(
         self,
@@ -58,14 +66,17 @@ class SupabaseStorage:
             
             candidate_id = candidate_result.data[0]["id"]
             
-            # Save analysis
+            # Save analysis; model_dump(mode="json") serializes the report in
+            # pydantic-core and already renders datetimes as ISO strings
+            report_data = report.model_dump(mode="json")
+            evidence_data = report_data["evidence"]
             analysis_data = {
                 "candidate_id": candidate_id,
                 "overall_score": report.overall_score,
-                "report": report.dict(),
-                "ai_detection": report.evidence.ai.dict() if report.evidence.ai else None,
-                "contact_verification": report.evidence.contact.dict() if report.evidence.contact else None,
-                "created_at": report.generated_at.isoformat()
+                "report": report_data,
+                "ai_detection": evidence_data["ai"],
+                "contact_verification": evidence_data["contact"],
+                "created_at": report_data["generated_at"]
             }
             
             analysis_result = self.supabase.table("analyses").insert(analysis_data).execute()
@@ -80,7 +91,7 @@ class SupabaseStorage:
                 "analysis_id": analysis_id,
                 "reviewer_id": "system",
                 "review_notes": f"Automated analysis completed with {report.overall_score}% risk score",
-                "created_at": report.generated_at.isoformat()
+                "created_at": report_data["generated_at"]
             }
             
             history_result = self.supabase.table("review_history").insert(history_data).execute()
@@ -31,12 +31,12 @@ async def test_basic_functionality():
     print("✓ Testing contact info detector...")
     contact_detector = ContactInfoDetector()
     
-    # Test email validation
-    email_result = await contact_detector._verify_email("test@example.com")
+    # Test email and phone validation concurrently
+    email_result, phone_result = await asyncio.gather(
+        contact_detector._verify_email("test@example.com"),
+        contact_detector._verify_phone("+1-555-123-4567")
+    )
     print(f"  Email validation: {email_result}")
-    
-    # Test phone validation
-    phone_result = await contact_detector._verify_phone("+1-555-123-4567")
     print(f"  Phone validation: {phone_result}")
     
     print("✓ All basic tests passed!")
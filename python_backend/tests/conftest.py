@@ -4,29 +4,45 @@ Pytest configuration and fixtures for the fraud detection system.
 
 import pytest
 import asyncio
-import os
+import copy
 import sys
+import orjson
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch
-from typing import Dict, Any, Optional
-
-# Add the parent directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 
 from utils.config import Settings
 from models.schemas import (
-    CandidateInfo, AiDetectionResult, DocumentAuthenticityResult,
-    ContactVerificationResult, BackgroundVerificationResult, DigitalFootprintResult
+    CandidateInfo, AiDetectionResult, DocumentAuthenticityResult, DigitalFootprintResult
+)
+from tests.factories import (
+    make_ai_detection, make_document_authenticity, make_contact_verification,
+    make_background_verification, make_digital_footprint
 )
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_configure(config):
+    """
+    Run async tests on uvloop when it is installed (it ships with uvicorn[standard]).
 
-@pytest.fixture
+    Only the policy is swapped; pytest-asyncio still creates each test's loop,
+    now from uvloop's policy.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+@pytest.fixture(autouse=True)
+def clear_cached_clients():
+    """Drop memoised Supabase clients so a mocked client never leaks between tests."""
+    yield
+    supabase_client = sys.modules.get("storage.supabase_client")
+    if supabase_client is not None:
+        supabase_client._get_client.cache_clear()
+
+@pytest.fixture(scope="session")
 def test_settings():
     """Create test settings with mock API keys."""
     return Settings(
@@ -42,7 +58,7 @@ def test_settings():
         sec_contact_email="test@example.com"
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_candidate_info():
     """Create mock candidate information."""
     return CandidateInfo(
@@ -55,7 +71,7 @@ def mock_candidate_info():
         website="https://johndoe.com"
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ai_detection():
     """Create mock AI detection result."""
     return AiDetectionResult(
@@ -65,7 +81,7 @@ def mock_ai_detection():
         rationale="Human-written content with natural patterns"
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_document_authenticity():
     """Create mock document authenticity result."""
     return DocumentAuthenticityResult(
@@ -92,7 +108,7 @@ def mock_document_authenticity():
 
 @pytest.fixture
 def mock_contact_verification():
-    """Create mock contact verification result."""
+    """Create mock contact verification result; a fresh dict per test so one test's changes never leak into another."""
     return {
         "email": {
             "input": "john.doe@example.com",
@@ -144,7 +160,7 @@ def mock_contact_verification():
 
 @pytest.fixture
 def mock_background_verification():
-    """Create mock background verification result."""
+    """Create mock background verification result; a fresh dict per test so one test's changes never leak into another."""
     return {
         "company_evidence": {
             "Google": {
@@ -185,7 +201,7 @@ def mock_background_verification():
         "sources_used": ["GLEIF", "SEC EDGAR", "OpenAlex", "Wayback CDX", "GitHub", "US College Scorecard"]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_digital_footprint():
     """Create mock digital footprint result."""
     return DigitalFootprintResult(
@@ -198,7 +214,7 @@ def mock_digital_footprint():
         details="Found 10 search results. Professional presence on: linkedin, github. Sources used: serpapi"
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_content():
     """Create sample PDF content for testing."""
     return b"""%PDF-1.4
@@ -257,7 +273,7 @@ startxref
 304
 %%EOF"""
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malicious_pdf_content():
     """Create malicious PDF content for security testing."""
     return b"""%PDF-1.4
@@ -319,6 +335,18 @@ startxref
 284
 %%EOF"""
 
+@pytest.fixture(scope="session")
+def pdf_document_mock_factory():
+    """Factory for ``pypdfium2.PdfDocument`` stand-ins with one page yielding ``text``."""
+    def _make(text: str = "John Doe\nSoftware Engineer\njohn.doe@example.com") -> MagicMock:
+        page = Mock()
+        page.get_textpage.return_value.get_text_range.return_value = text
+        document = MagicMock()
+        document.__len__.return_value = 1
+        document.__getitem__.return_value = page
+        return document
+    return _make
+
 @pytest.fixture
 def mock_http_client():
     """Create mock HTTP client for API testing."""
@@ -334,3 +362,89 @@ def mock_cached_api_client():
     client.get = AsyncMock()
     client.post = AsyncMock()
     return client
+
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI application, imported on first use and shared for the session."""
+    from main import app as application
+    return application
+
+
+@pytest.fixture(scope="session")
+def analyzer(test_settings):
+    """
+    Create one ResumeAnalyzer per session (per xdist worker).
+
+    Tests patch it through monkeypatch or the analyzer_mocks fixture, both of
+    which restore the originals at teardown, so sharing the instance is safe.
+    """
+    from orchestrator.analyzer import ResumeAnalyzer
+    return ResumeAnalyzer(test_settings)
+
+
+@pytest.fixture(scope="session")
+def contact_service():
+    """
+    One ContactVerificationService per session (per xdist worker).
+
+    The import happens here so test modules that never ask for the service
+    don't pay for its DNS/HTTP dependencies at collection time.
+    """
+    from detectors.contact_verification import ContactVerificationService
+    return ContactVerificationService(
+        numverify_api_key="test_numverify_key",
+        abstract_api_key="test_abstract_key"
+    )
+
+@pytest.fixture(scope="session")
+def contact_service_no_numverify():
+    """A ContactVerificationService without a NumVerify key, so phone checks never call the API."""
+    from detectors.contact_verification import ContactVerificationService
+    return ContactVerificationService(
+        numverify_api_key=None,
+        abstract_api_key="test_abstract_key"
+    )
+
+@pytest.fixture
+def isolated_api_cache(monkeypatch):
+    """Give the test an empty API response cache so nothing is shared or cleared."""
+    import utils.cached_api_client
+    from utils.cache import MemoryCache
+    monkeypatch.setattr(utils.cached_api_client, 'api_cache', MemoryCache())
+
+# Canned detector results for analyzer tests, built once per process
+_ANALYZER_AI_RESULT = make_ai_detection()
+_ANALYZER_DOCUMENT_RESULT = make_document_authenticity()
+_ANALYZER_CONTACT_RESULT = make_contact_verification()
+_ANALYZER_BACKGROUND_RESULT = make_background_verification()
+_ANALYZER_DIGITAL_FOOTPRINT_RESULT = make_digital_footprint()
+
+_CANNED_SCANS_PATH = Path(__file__).parent / "data" / "canned_scans.json"
+
+@pytest.fixture(scope="session")
+def canned_scans():
+    """Canned ``FileSecurityScanner.scan_file`` results keyed by scenario."""
+    return orjson.loads(_CANNED_SCANS_PATH.read_bytes())
+
+@pytest.fixture
+def analyzer_mocks(analyzer, canned_scans):
+    """
+    Patch every detector the analyzer calls with canned results.
+
+    Tests override only what they care about, e.g.
+    ``analyzer_mocks.ai.side_effect = Exception(...)``.
+    """
+    with ExitStack() as stack:
+        def patch_obj(target, attribute, result):
+            return stack.enter_context(
+                patch.object(target, attribute, new_callable=AsyncMock, return_value=result)
+            )
+
+        yield SimpleNamespace(
+            ai=patch_obj(analyzer.ai_detector, 'detect_ai_content', _ANALYZER_AI_RESULT),
+            document=patch_obj(analyzer.document_detector, 'analyze_document_authenticity', _ANALYZER_DOCUMENT_RESULT),
+            contact=patch_obj(analyzer, '_verify_contact_info', _ANALYZER_CONTACT_RESULT),
+            background=patch_obj(analyzer, '_verify_background', _ANALYZER_BACKGROUND_RESULT),
+            digital_footprint=patch_obj(analyzer, '_analyze_digital_footprint', _ANALYZER_DIGITAL_FOOTPRINT_RESULT),
+            security=patch_obj(analyzer.security_scanner, 'scan_file', copy.copy(canned_scans["safe"])),
+        )
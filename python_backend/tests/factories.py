@@ -0,0 +1,102 @@
+"""
+Builders for detector results used across tests.
+
+Each builder merges keyword overrides into module-level defaults and returns
+the production type, so schema drift fails at test time instead of being
+hidden behind a Mock.
+"""
+
+from typing import Any, Dict
+
+from models.schemas import AiDetectionResult, DocumentAuthenticityResult, DigitalFootprintResult
+
+AI_DETECTION_DEFAULTS = {
+    "is_ai_generated": False,
+    "confidence": 25,
+    "model": "claude-sonnet-4",
+    "rationale": "Human-written content",
+}
+
+DOCUMENT_AUTHENTICITY_DEFAULTS = {
+    "fileName": "test_resume.pdf",
+    "fileSize": 1024,
+    "fileType": "application/pdf",
+    "creationDate": "2024-01-01T00:00:00Z",
+    "modificationDate": "2024-01-01T00:00:00Z",
+    "author": "John Doe",
+    "creator": "Microsoft Word",
+    "producer": "Microsoft Word",
+    "title": "John Doe Resume",
+    "subject": "Software Engineer Resume",
+    "keywords": "software, engineer, python, javascript",
+    "pdfVersion": "1.4",
+    "pageCount": 1,
+    "isEncrypted": False,
+    "hasDigitalSignature": False,
+    "softwareUsed": "Microsoft Word",
+    "suspiciousIndicators": [],
+    "authenticityScore": 85,
+    "rationale": "Document appears authentic",
+}
+
+CONTACT_VERIFICATION_DEFAULTS = {
+    "email": "john.doe@example.com",
+    "phone": "+1234567890",
+    "is_verified": True,
+    "details": "Contact information verified",
+    "email_valid": True,
+    "email_disposable": False,
+    "phone_valid": True,
+    "phone_carrier": "Verizon Wireless",
+    "geo_consistent": True,
+}
+
+BACKGROUND_VERIFICATION_DEFAULTS = {
+    "company_evidence": {},
+    "education_evidence": {},
+    "developer_evidence": {},
+    "timeline_assessment": {},
+    "score": {
+        "company_identity_score": 0.9,
+        "education_institution_score": 1.0,
+        "timeline_corroboration_score": 0.8,
+        "developer_footprint_score": 0.7,
+        "composite": 0.85,
+    },
+    "rationale": ["Background verification completed"],
+    "sources_used": ["GLEIF", "SEC EDGAR", "OpenAlex", "GitHub"],
+}
+
+DIGITAL_FOOTPRINT_DEFAULTS = {
+    "social_presence": {
+        "linkedin": [{"title": "John Doe", "link": "https://linkedin.com/in/johndoe", "snippet": "Software Engineer"}]
+    },
+    "search_results": ["John Doe Software Engineer"],
+    "consistency_score": 95,
+    "details": "Digital footprint analysis completed",
+}
+
+
+def make_ai_detection(**overrides: Any) -> AiDetectionResult:
+    """Build an AiDetectionResult."""
+    return AiDetectionResult(**{**AI_DETECTION_DEFAULTS, **overrides})
+
+
+def make_document_authenticity(**overrides: Any) -> DocumentAuthenticityResult:
+    """Build a DocumentAuthenticityResult."""
+    return DocumentAuthenticityResult(**{**DOCUMENT_AUTHENTICITY_DEFAULTS, **overrides})
+
+
+def make_contact_verification(**overrides: Any) -> Dict[str, Any]:
+    """Build a contact verification payload (the analyzer passes these as dicts)."""
+    return {**CONTACT_VERIFICATION_DEFAULTS, **overrides}
+
+
+def make_background_verification(**overrides: Any) -> Dict[str, Any]:
+    """Build a background verification payload (the analyzer passes these as dicts)."""
+    return {**BACKGROUND_VERIFICATION_DEFAULTS, **overrides}
+
+
+def make_digital_footprint(**overrides: Any) -> DigitalFootprintResult:
+    """Build a DigitalFootprintResult."""
+    return DigitalFootprintResult(**{**DIGITAL_FOOTPRINT_DEFAULTS, **overrides})
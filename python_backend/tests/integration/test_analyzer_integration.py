@@ -2,132 +2,28 @@
 Integration tests for the main analyzer.
 """
 
-import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from orchestrator.analyzer import ResumeAnalyzer
-from utils.config import Settings
+import asyncio
+import copy
+import json
+from unittest.mock import Mock, MagicMock, AsyncMock
+from models.background_schemas import BackgroundVerifyResponse
+from models.schemas import CandidateInfo
+from tests.factories import (
+    make_ai_detection, make_document_authenticity, make_contact_verification,
+    make_background_verification, make_digital_footprint
+)
 
 
 class TestAnalyzerIntegration:
     """Integration tests for ResumeAnalyzer."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.settings = Settings(
-            aws_access_key_id="test_key",
-            aws_secret_access_key="test_secret",
-            aws_region="us-east-1",
-            numverify_api_key="test_numverify_key",
-            abstract_api_key="test_abstract_key",
-            serpapi_key="test_serpapi_key",
-            github_token="test_github_token",
-            openalex_contact_email="test@example.com",
-            college_scorecard_key="test_college_key",
-            sec_contact_email="test@example.com"
-        )
-        self.analyzer = ResumeAnalyzer(self.settings)
-
-    @pytest.mark.asyncio
-    async def test_analyze_file_complete_flow(self, sample_pdf_content):
+    async def test_analyze_file_complete_flow(self, analyzer, analyzer_mocks, sample_pdf_content):
         """Test complete file analysis flow."""
         filename = "test_resume.pdf"
         file_type = "application/pdf"
         candidate_hints = {"full_name": "John Doe", "email": "john.doe@example.com"}
         
-        # Mock all the detector methods
-        with patch.object(self.analyzer.ai_detector, 'detect_ai_content') as mock_ai:
-            mock_ai.return_value = Mock(
-                is_ai_generated=False,
-                confidence=25,
-                model="claude-sonnet-4",
-                rationale="Human-written content"
-            )
-        
-        with patch.object(self.analyzer.document_detector, 'analyze_document_authenticity') as mock_doc:
-            mock_doc.return_value = Mock(
-                fileName=filename,
-                fileSize=len(sample_pdf_content),
-                fileType=file_type,
-                creationDate="2024-01-01T00:00:00Z",
-                modificationDate="2024-01-01T00:00:00Z",
-                author="John Doe",
-                creator="Microsoft Word",
-                producer="Microsoft Word",
-                title="John Doe Resume",
-                subject="Software Engineer Resume",
-                keywords="software, engineer, python, javascript",
-                pdfVersion="1.4",
-                pageCount=1,
-                isEncrypted=False,
-                hasDigitalSignature=False,
-                softwareUsed="Microsoft Word",
-                suspiciousIndicators=[],
-                authenticityScore=85,
-                rationale="Document appears authentic"
-            )
-        
-        with patch.object(self.analyzer.contact_detector, 'verify_contact_info') as mock_contact:
-            mock_contact.return_value = Mock(
-                email="john.doe@example.com",
-                phone="+1234567890",
-                is_verified=True,
-                details="Contact information verified",
-                email_valid=True,
-                email_disposable=False,
-                phone_valid=True,
-                phone_carrier="Verizon Wireless",
-                geo_consistent=True
-            )
-        
-        with patch.object(self.analyzer, '_verify_background') as mock_background:
-            mock_background.return_value = Mock(
-                company_evidence={},
-                education_evidence={},
-                developer_evidence={},
-                timeline_assessment={},
-                score={
-                    "company_identity_score": 0.9,
-                    "education_institution_score": 1.0,
-                    "timeline_corroboration_score": 0.8,
-                    "developer_footprint_score": 0.7,
-                    "composite": 0.85
-                },
-                rationale=["Background verification completed"],
-                sources_used=["GLEIF", "SEC EDGAR", "OpenAlex", "GitHub"]
-            )
-        
-        with patch.object(self.analyzer, '_analyze_digital_footprint') as mock_digital:
-            mock_digital.return_value = Mock(
-                social_presence={
-                    "linkedin": [{"title": "John Doe", "link": "https://linkedin.com/in/johndoe", "snippet": "Software Engineer"}]
-                },
-                search_results=["John Doe Software Engineer"],
-                consistency_score=95,
-                details="Digital footprint analysis completed"
-            )
-        
-        with patch.object(self.analyzer.security_scanner, 'scan_file') as mock_security:
-            mock_security.return_value = {
-                "is_safe": True,
-                "threats_detected": [],
-                "warnings": [],
-                "file_info": {
-                    "name": filename,
-                    "extension": ".pdf",
-                    "size": len(sample_pdf_content),
-                    "mime_type": file_type,
-                    "sha256": "test_hash"
-                },
-                "scan_details": {
-                    "total_checks": 8,
-                    "threats_found": 0,
-                    "warnings_found": 0,
-                    "file_hash": "test_hash",
-                    "scan_timestamp": "2024-01-01T00:00:00Z"
-                }
-            }
-        
-        result = await self.analyzer.analyze_file(sample_pdf_content, filename, file_type, candidate_hints)
+        result = await analyzer.analyze_file(sample_pdf_content, filename, file_type, candidate_hints)
         
         # Verify the result structure
         assert result.extractedText is not None
@@ -145,100 +41,81 @@ class TestAnalyzerIntegration:
         assert len(result.aggregatedReport.slices) > 0
         assert result.aggregatedReport.evidence is not None
 
-    @pytest.mark.asyncio
-    async def test_analyze_file_security_failure(self, malicious_pdf_content):
+    async def test_analyze_file_security_failure(self, analyzer, analyzer_mocks, malicious_pdf_content, canned_scans):
         """Test file analysis when security scan fails."""
         filename = "malicious.pdf"
         file_type = "application/pdf"
         
-        with patch.object(self.analyzer.security_scanner, 'scan_file') as mock_security:
-            mock_security.return_value = {
-                "is_safe": False,
-                "threats_detected": [
-                    {"type": "pdf_javascript", "severity": "high", "message": "PDF contains JavaScript"}
-                ],
-                "warnings": [],
-                "file_info": {
-                    "name": filename,
-                    "extension": ".pdf",
-                    "size": len(malicious_pdf_content),
-                    "mime_type": file_type,
-                    "sha256": "test_hash"
-                },
-                "scan_details": {
-                    "total_checks": 8,
-                    "threats_found": 1,
-                    "warnings_found": 0,
-                    "file_hash": "test_hash",
-                    "scan_timestamp": "2024-01-01T00:00:00Z"
-                }
-            }
-        
-        result = await self.analyzer.analyze_file(malicious_pdf_content, filename, file_type)
-        
-        # Should return early with security warning
-        assert result.aggregatedReport.overall_score == 0
-        assert result.aggregatedReport.evidence.security is not None
-        assert result.aggregatedReport.evidence.security["is_safe"] is False
-        assert len(result.aggregatedReport.evidence.security["threats_detected"]) > 0
+        analyzer_mocks.security.return_value = copy.copy(canned_scans["malicious_pdf_js"])
+        
+        result = await analyzer.analyze_file(malicious_pdf_content, filename, file_type)
+        
+        # Should return early with security warning and no detector evidence
+        report = result.aggregatedReport
+        assert report.overall_score == 0
+        assert report.slices == []
+        assert report.evidence.security is None
+        assert report.rationale == ["File failed security scan and was not processed"]
+        assert result.documentAuthenticity.suspiciousIndicators == [
+            threat["message"] for threat in canned_scans["malicious_pdf_js"]["threats_detected"]
+        ]
+        assert result.contactVerification is None
+        analyzer_mocks.ai.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_analyze_file_detector_failure(self, sample_pdf_content):
+    async def test_analyze_file_detector_failure(self, analyzer, analyzer_mocks, sample_pdf_content):
         """Test file analysis when individual detectors fail."""
         filename = "test.pdf"
         file_type = "application/pdf"
         
-        with patch.object(self.analyzer.security_scanner, 'scan_file') as mock_security:
-            mock_security.return_value = {
-                "is_safe": True,
-                "threats_detected": [],
-                "warnings": [],
-                "file_info": {
-                    "name": filename,
-                    "extension": ".pdf",
-                    "size": len(sample_pdf_content),
-                    "mime_type": file_type,
-                    "sha256": "test_hash"
-                },
-                "scan_details": {
-                    "total_checks": 8,
-                    "threats_found": 0,
-                    "warnings_found": 0,
-                    "file_hash": "test_hash",
-                    "scan_timestamp": "2024-01-01T00:00:00Z"
-                }
-            }
-        
-        # Mock AI detector to fail
-        with patch.object(self.analyzer.ai_detector, 'detect_ai_content') as mock_ai:
-            mock_ai.side_effect = Exception("AI detection failed")
-        
-        # Mock document detector to fail
-        with patch.object(self.analyzer.document_detector, 'analyze_document_authenticity') as mock_doc:
-            mock_doc.side_effect = Exception("Document analysis failed")
-        
-        # Mock contact detector to fail
-        with patch.object(self.analyzer.contact_detector, 'verify_contact_info') as mock_contact:
-            mock_contact.side_effect = Exception("Contact verification failed")
-        
-        # Mock background verification to fail
-        with patch.object(self.analyzer, '_verify_background') as mock_background:
-            mock_background.side_effect = Exception("Background verification failed")
-        
-        # Mock digital footprint to fail
-        with patch.object(self.analyzer, '_analyze_digital_footprint') as mock_digital:
-            mock_digital.side_effect = Exception("Digital footprint analysis failed")
-        
-        result = await self.analyzer.analyze_file(sample_pdf_content, filename, file_type)
+        analyzer_mocks.ai.side_effect = Exception("AI detection failed")
+        analyzer_mocks.document.side_effect = Exception("Document analysis failed")
+        analyzer_mocks.contact.side_effect = Exception("Contact verification failed")
+        analyzer_mocks.background.side_effect = Exception("Background verification failed")
+        analyzer_mocks.digital_footprint.side_effect = Exception("Digital footprint analysis failed")
+        
+        result = await analyzer.analyze_file(sample_pdf_content, filename, file_type)
         
         # Should still return a result with fallback values
         assert result is not None
         assert result.aggregatedReport is not None
         assert result.aggregatedReport.evidence is not None
 
-    @pytest.mark.asyncio
-    async def test_extract_candidate_info_with_hints(self):
-        """Test candidate information extraction with hints."""
+    async def test_analyze_file_runs_detectors_concurrently(self, analyzer, analyzer_mocks, sample_pdf_content, monkeypatch):
+        """Test that every detector starts before any of them finishes."""
+        slow_mocks = [
+            analyzer_mocks.ai, analyzer_mocks.document, analyzer_mocks.contact,
+            analyzer_mocks.background, analyzer_mocks.digital_footprint
+        ]
+        all_started = asyncio.Event()
+        started = 0
+        started_at_finish = []
+        
+        async def blocking_detector(*args, **kwargs):
+            nonlocal started
+            started += 1
+            if started == len(slow_mocks):
+                all_started.set()
+            try:
+                # Serial execution never reaches the set() above; fail instead of hanging
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+            finally:
+                started_at_finish.append(started)
+            raise Exception("Detector failed")
+        
+        for mock in slow_mocks:
+            mock.side_effect = blocking_detector
+        
+        mock_extract = AsyncMock()
+        monkeypatch.setattr(analyzer, '_extract_candidate_info', mock_extract)
+        mock_extract.return_value = CandidateInfo(full_name="John Doe")
+        
+        result = await analyzer.analyze_file(sample_pdf_content, "test.pdf", "application/pdf")
+        
+        assert result.aggregatedReport is not None
+        assert started_at_finish == [len(slow_mocks)] * len(slow_mocks)
+
+    async def test_extract_candidate_info_with_hints(self, analyzer, monkeypatch):
+        """Test candidate information is taken from hints without calling Bedrock."""
         text = "John Doe is a software engineer with 5 years of experience."
         candidate_hints = {
             "full_name": "John Doe",
@@ -246,49 +123,43 @@ class TestAnalyzerIntegration:
             "phone": "+1234567890"
         }
         
-        with patch.object(self.analyzer.ai_detector, 'extract_candidate_info') as mock_extract:
-            mock_extract.return_value = Mock(
-                full_name="John Doe",
-                email="john.doe@example.com",
-                phone="+1234567890",
-                location="New York, NY",
-                linkedin="https://linkedin.com/in/johndoe",
-                github="https://github.com/johndoe",
-                website="https://johndoe.com"
-            )
+        mock_bedrock = AsyncMock()
+        monkeypatch.setattr(analyzer, '_call_bedrock_for_extraction', mock_bedrock)
         
-        result = await self.analyzer._extract_candidate_info(text, candidate_hints)
+        result = await analyzer._extract_candidate_info(text, candidate_hints)
         
         assert result.full_name == "John Doe"
         assert result.email == "john.doe@example.com"
         assert result.phone == "+1234567890"
+        mock_bedrock.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_extract_candidate_info_without_hints(self):
-        """Test candidate information extraction without hints."""
+    async def test_extract_candidate_info_without_hints(self, analyzer, monkeypatch):
+        """Test candidate information is parsed from the Bedrock <extract> block."""
         text = "John Doe is a software engineer with 5 years of experience. Contact: john.doe@example.com, +1234567890"
+        extracted = {
+            "full_name": "John Doe",
+            "email": "john.doe@example.com",
+            "phone": "+1234567890",
+            "location": "New York, NY",
+            "linkedin": None,
+            "github": None,
+            "website": None
+        }
         
-        with patch.object(self.analyzer.ai_detector, 'extract_candidate_info') as mock_extract:
-            mock_extract.return_value = Mock(
-                full_name="John Doe",
-                email="john.doe@example.com",
-                phone="+1234567890",
-                location="New York, NY",
-                linkedin=None,
-                github=None,
-                website=None
-            )
+        mock_bedrock = AsyncMock(return_value={"rationale": f"<extract>{json.dumps(extracted)}</extract>"})
+        monkeypatch.setattr(analyzer, '_call_bedrock_for_extraction', mock_bedrock)
         
-        result = await self.analyzer._extract_candidate_info(text, None)
+        result = await analyzer._extract_candidate_info(text, None)
         
         assert result.full_name == "John Doe"
         assert result.email == "john.doe@example.com"
         assert result.phone == "+1234567890"
+        assert result.location == "New York, NY"
+        mock_bedrock.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_verify_background_integration(self):
+    async def test_verify_background_integration(self, analyzer, monkeypatch):
         """Test background verification integration."""
-        candidate_info = Mock(
+        candidate_info = CandidateInfo(
             full_name="John Doe",
             email="john.doe@example.com",
             phone="+1234567890",
@@ -298,142 +169,62 @@ class TestAnalyzerIntegration:
             website="https://johndoe.com"
         )
         
-        with patch('background_verification.logic.run_background_verification') as mock_background:
-            mock_background.return_value = Mock(
-                company_evidence={},
-                education_evidence={},
-                developer_evidence={},
-                timeline_assessment={},
-                score={
-                    "company_identity_score": 0.9,
-                    "education_institution_score": 1.0,
-                    "timeline_corroboration_score": 0.8,
-                    "developer_footprint_score": 0.7,
-                    "composite": 0.85
-                },
-                rationale=["Background verification completed"],
-                sources_used=["GLEIF", "SEC EDGAR", "OpenAlex", "GitHub"]
-            )
-            
-            result = await self.analyzer._verify_background(candidate_info)
-            
-            assert result is not None
-            assert result.score["composite"] == 0.85
-
-    @pytest.mark.asyncio
-    async def test_analyze_digital_footprint_integration(self):
-        """Test digital footprint analysis integration."""
-        full_name = "John Doe"
-        email = "john.doe@example.com"
-        phone = "+1234567890"
-        
-        with patch('detectors.digital_footprint.DigitalFootprintService') as mock_service_class:
-            mock_service = Mock()
-            mock_service.analyze_digital_footprint.return_value = Mock(
-                social_presence={
-                    "linkedin": [{"title": "John Doe", "link": "https://linkedin.com/in/johndoe", "snippet": "Software Engineer"}]
-                },
-                search_results=["John Doe Software Engineer"],
-                consistency_score=95,
-                details="Digital footprint analysis completed"
-            )
-            mock_service_class.return_value = mock_service
-            
-            result = await self.analyzer._analyze_digital_footprint(full_name, email, phone)
-            
-            assert result is not None
-            assert result.consistency_score == 95
-
-    @pytest.mark.asyncio
-    async def test_create_aggregated_report(self):
-        """Test aggregated report creation."""
-        ai_detection = Mock(
-            is_ai_generated=False,
-            confidence=25,
-            model="claude-sonnet-4",
-            rationale="Human-written content"
-        )
+        monkeypatch.setattr(analyzer, '_extract_positions_from_text', AsyncMock(return_value=[]))
+        monkeypatch.setattr(analyzer, '_extract_educations_from_text', AsyncMock(return_value=[]))
+        mock_background = AsyncMock(return_value=BackgroundVerifyResponse(**make_background_verification()))
+        monkeypatch.setattr('background_verification.logic.run_background_verification', mock_background)
         
-        document_authenticity = Mock(
-            fileName="test.pdf",
-            fileSize=1024,
-            fileType="application/pdf",
-            creationDate="2024-01-01T00:00:00Z",
-            modificationDate="2024-01-01T00:00:00Z",
-            author="John Doe",
-            creator="Microsoft Word",
-            producer="Microsoft Word",
-            title="John Doe Resume",
-            subject="Software Engineer Resume",
-            keywords="software, engineer, python, javascript",
-            pdfVersion="1.4",
-            pageCount=1,
-            isEncrypted=False,
-            hasDigitalSignature=False,
-            softwareUsed="Microsoft Word",
-            suspiciousIndicators=[],
-            authenticityScore=85,
-            rationale="Document appears authentic"
-        )
+        result = await analyzer._verify_background(candidate_info, "John Doe\nSoftware Engineer")
         
-        contact_verification = Mock(
+        assert result is not None
+        assert result["score"]["composite"] == 0.85
+        request = mock_background.await_args.args[0]
+        assert request.full_name == "John Doe"
+        assert request.identifiers.github_username == "johndoe"
+        assert str(request.identifiers.personal_site) == "https://johndoe.com/"
+
+    async def test_analyze_digital_footprint_integration(self, analyzer, test_settings, monkeypatch):
+        """Test digital footprint analysis integration."""
+        candidate_info = CandidateInfo(
+            full_name="John Doe",
             email="john.doe@example.com",
-            phone="+1234567890",
-            is_verified=True,
-            details="Contact information verified",
-            email_valid=True,
-            email_disposable=False,
-            phone_valid=True,
-            phone_carrier="Verizon Wireless",
-            geo_consistent=True
+            phone="+1234567890"
         )
         
-        background_verification = Mock(
-            company_evidence={},
-            education_evidence={},
-            developer_evidence={},
-            timeline_assessment={},
-            score={
-                "company_identity_score": 0.9,
-                "education_institution_score": 1.0,
-                "timeline_corroboration_score": 0.8,
-                "developer_footprint_score": 0.7,
-                "composite": 0.85
-            },
-            rationale=["Background verification completed"],
-            sources_used=["GLEIF", "SEC EDGAR", "OpenAlex", "GitHub"]
-        )
+        mock_service_class = MagicMock()
+        mock_service_class.return_value.analyze_digital_footprint = AsyncMock(return_value={
+            "google_search": [
+                {"title": "John Doe", "link": "https://linkedin.com/in/johndoe", "snippet": "Software Engineer"},
+                {"title": "John Doe's blog", "link": "https://johndoe.com", "snippet": "Notes"}
+            ],
+            "score": 0.95,
+            "sources_used": ["serpapi"]
+        })
+        monkeypatch.setattr('detectors.digital_footprint.DigitalFootprintService', mock_service_class)
+        monkeypatch.setattr('utils.config.get_settings', lambda: test_settings)
+        
+        result = await analyzer._analyze_digital_footprint(candidate_info)
         
-        digital_footprint = Mock(
-            social_presence={
-                "linkedin": [{"title": "John Doe", "link": "https://linkedin.com/in/johndoe", "snippet": "Software Engineer"}]
-            },
-            search_results=["John Doe Software Engineer"],
-            consistency_score=95,
-            details="Digital footprint analysis completed"
+        assert result is not None
+        assert result.consistency_score == 95
+        assert result.search_results == ["John Doe", "John Doe's blog"]
+        assert list(result.social_presence) == ["linkedin"]
+        mock_service_class.assert_called_once_with(serpapi_key="test_serpapi_key")
+        mock_service_class.return_value.analyze_digital_footprint.assert_awaited_once_with(
+            full_name="John Doe", email="john.doe@example.com", phone="+1234567890"
         )
+
+    async def test_create_aggregated_report(self, analyzer, canned_scans):
+        """Test aggregated report creation."""
+        ai_detection = make_ai_detection()
+        document_authenticity = make_document_authenticity(fileName="test.pdf")
+        contact_verification = make_contact_verification()
+        background_verification = make_background_verification()
+        digital_footprint = make_digital_footprint()
         
-        security_scan = {
-            "is_safe": True,
-            "threats_detected": [],
-            "warnings": [],
-            "file_info": {
-                "name": "test.pdf",
-                "extension": ".pdf",
-                "size": 1024,
-                "mime_type": "application/pdf",
-                "sha256": "test_hash"
-            },
-            "scan_details": {
-                "total_checks": 8,
-                "threats_found": 0,
-                "warnings_found": 0,
-                "file_hash": "test_hash",
-                "scan_timestamp": "2024-01-01T00:00:00Z"
-            }
-        }
+        security_scan = copy.copy(canned_scans["safe"])
         
-        result = await self.analyzer._create_aggregated_report(
+        result = await analyzer._create_aggregated_report(
             ai_detection, document_authenticity, contact_verification,
             background_verification, digital_footprint, security_scan
         )
@@ -449,49 +240,75 @@ class TestAnalyzerIntegration:
         assert result.evidence.digital_footprint == digital_footprint
         assert result.evidence.security == security_scan
 
-    @pytest.mark.asyncio
-    async def test_extract_text_content_pdf(self, sample_pdf_content):
+    async def test_extract_text_content_pdf(self, analyzer, sample_pdf_content, pdf_document_mock_factory, monkeypatch):
         """Test text extraction from PDF."""
         filename = "test.pdf"
         file_type = "application/pdf"
         
-        with patch('PyPDF2.PdfReader') as mock_reader:
-            mock_pdf = Mock()
-            mock_page = Mock()
-            mock_page.extract_text.return_value = "John Doe\nSoftware Engineer\njohn.doe@example.com"
-            mock_pdf.pages = [mock_page]
-            mock_reader.return_value = mock_pdf
-            
-            result = await self.analyzer._extract_text_content(sample_pdf_content, filename, file_type)
-            
-            assert "John Doe" in result
-            assert "Software Engineer" in result
-            assert "john.doe@example.com" in result
+        monkeypatch.setattr('pypdfium2.PdfDocument', Mock(return_value=pdf_document_mock_factory()))
+        
+        result = await analyzer._extract_text_content(sample_pdf_content, filename, file_type)
+        
+        assert "John Doe" in result
+        assert "Software Engineer" in result
+        assert "john.doe@example.com" in result
 
-    @pytest.mark.asyncio
-    async def test_extract_text_content_docx(self):
+    async def test_extract_text_content_docx(self, analyzer, monkeypatch):
         """Test text extraction from DOCX."""
         filename = "test.docx"
         file_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         docx_content = b'PK\x03\x04'
         
-        with patch('zipfile.ZipFile') as mock_zip:
-            mock_zip_file = Mock()
-            mock_zip_file.read.return_value = b'<?xml version="1.0"?><document><body><p>John Doe</p><p>Software Engineer</p></body></document>'
-            mock_zip.return_value.__enter__.return_value = mock_zip_file
-            
-            result = await self.analyzer._extract_text_content(docx_content, filename, file_type)
-            
-            assert "John Doe" in result
-            assert "Software Engineer" in result
+        mock_zip = MagicMock()
+        monkeypatch.setattr('zipfile.ZipFile', mock_zip)
+        mock_zip_file = Mock()
+        mock_zip_file.read.return_value = (
+            b'<?xml version="1.0"?>'
+            b'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+            b'<w:p><w:r><w:t>John Doe</w:t></w:r></w:p>'
+            b'<w:p><w:r><w:t>Software Engineer</w:t></w:r></w:p>'
+            b'</w:body></w:document>'
+        )
+        mock_zip.return_value.__enter__.return_value = mock_zip_file
+        
+        result = await analyzer._extract_text_content(docx_content, filename, file_type)
+        
+        assert "John Doe" in result
+        assert "Software Engineer" in result
+
+    async def test_extract_text_content_docx_layout(self, analyzer, monkeypatch):
+        """Test DOCX tabs and line breaks survive and text boxes are read once."""
+        filename = "test.docx"
+        file_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        docx_content = b'PK\x03\x04'
+        
+        mock_zip = MagicMock()
+        monkeypatch.setattr('zipfile.ZipFile', mock_zip)
+        mock_zip_file = Mock()
+        mock_zip_file.read.return_value = (
+            b'<?xml version="1.0"?>'
+            b'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+            b' xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"><w:body>'
+            b'<w:p><w:r><w:t>John Doe</w:t><w:tab/><w:t>Software Engineer</w:t>'
+            b'<w:br/><w:t>San Francisco, CA</w:t></w:r></w:p>'
+            b'<w:p><w:r><mc:AlternateContent>'
+            b'<mc:Choice><w:drawing><w:txbxContent><w:p><w:r><w:t>Skills</w:t></w:r></w:p></w:txbxContent></w:drawing></mc:Choice>'
+            b'<mc:Fallback><w:pict><w:txbxContent><w:p><w:r><w:t>Skills</w:t></w:r></w:p></w:txbxContent></w:pict></mc:Fallback>'
+            b'</mc:AlternateContent><w:t>Python</w:t></w:r></w:p>'
+            b'</w:body></w:document>'
+        )
+        mock_zip.return_value.__enter__.return_value = mock_zip_file
+        
+        result = await analyzer._extract_text_content(docx_content, filename, file_type)
+        
+        assert result == "John Doe\tSoftware Engineer\nSan Francisco, CA\nPython\nSkills"
 
-    @pytest.mark.asyncio
-    async def test_extract_text_content_unsupported(self):
-        """Test text extraction from unsupported file type."""
+    async def test_extract_text_content_unsupported(self, analyzer):
+        """Test unsupported file types yield no text rather than raising."""
         filename = "test.txt"
         file_type = "text/plain"
         content = b"John Doe\nSoftware Engineer"
         
-        result = await self.analyzer._extract_text_content(content, filename, file_type)
+        result = await analyzer._extract_text_content(content, filename, file_type)
         
-        assert result == "John Doe\nSoftware Engineer"
+        assert result == ""
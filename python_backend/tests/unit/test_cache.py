@@ -0,0 +1,230 @@
+"""
+Unit tests for the two-level Redis-backed cache.
+"""
+
+import fnmatch
+
+import pytest
+from utils.cache import RedisBackedCache
+
+
+class FakeClock:
+    """Stands in for the ``time`` module inside utils.cache; advanced by hand."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """The slice of redis.asyncio.Redis the cache uses, backed by a dict of raw bytes."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+        self.calls = 0
+        self.scan_counts = []
+
+    def _check(self):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("Connection refused")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self._check()
+        assert isinstance(value, bytes)
+        self.data[key] = value
+
+    async def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match=None, count=None):
+        self._check()
+        self.scan_counts.append(count)
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues get/pttl calls and answers them from the parent FakeRedis."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get(self, key):
+        self.commands.append(("get", key))
+        return self
+
+    def pttl(self, key):
+        self.commands.append(("pttl", key))
+        return self
+
+    async def execute(self):
+        self.redis._check()
+        return [
+            self.redis.data.get(key) if command == "get" else 60_000
+            for command, key in self.commands
+        ]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the cache's monotonic clock at a controllable instant."""
+    fake = FakeClock()
+    monkeypatch.setattr("utils.cache.time", fake)
+    return fake
+
+
+@pytest.fixture
+def redis():
+    """An empty, reachable FakeRedis."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    """A cache whose Redis level is the FakeRedis above."""
+    cache = RedisBackedCache(max_size=10, redis_url="redis://fake", namespace="test")
+    cache._redis = redis
+    return cache
+
+
+class TestRedisBackedCache:
+    """Test cases for RedisBackedCache against an in-memory Redis."""
+
+    @pytest.mark.parametrize("value, tag", [
+        (b'{"data": 1}', b"b"),
+        (b"j-looking bytes", b"b"),
+        ({"data": [1, 2]}, b"j"),
+        ("text", b"j"),
+        (42, b"j"),
+    ])
+    async def test_values_round_trip_through_redis_with_type_tag(self, cache, redis, value, tag):
+        """Test bytes are stored raw under b, everything else as JSON under j, and both read back intact."""
+        await cache.set("key", value)
+
+        stored = redis.data["sentinelhire:test:key"]
+        assert stored[:1] == tag
+        # A second worker has an empty local level and reads through to Redis
+        other = RedisBackedCache(redis_url="redis://fake", namespace="test")
+        other._redis = redis
+        assert await other.get("key") == value
+
+    async def test_redis_hit_is_promoted_to_local_level(self, cache, redis):
+        """Test a value read from Redis is served locally on the next get."""
+        redis.data["sentinelhire:test:key"] = b"bpayload"
+
+        assert await cache.get("key") == b"payload"
+        calls = redis.calls
+        assert await cache.get("key") == b"payload"
+        assert redis.calls == calls
+
+    async def test_failure_opens_circuit_and_backoff_doubles(self, cache, redis, clock):
+        """Test Redis errors skip Redis for a growing backoff while the local level keeps serving."""
+        redis.down = True
+        await cache.set("a", b"payload")
+        assert cache._backoff_seconds == 1.0
+        calls = redis.calls
+
+        # Circuit open: no Redis calls, local hits still served
+        assert await cache.get("a") == b"payload"
+        assert await cache.get("missing") is None
+        assert redis.calls == calls
+        assert (await cache.get_stats())["redis_available"] is False
+
+        clock.advance(1.0)
+        assert await cache.get("missing") is None
+        assert redis.calls == calls + 1
+        assert cache._backoff_seconds == 2.0
+
+    async def test_backoff_is_capped(self, redis, clock):
+        """Test the backoff stops growing at max_backoff_seconds."""
+        cache = RedisBackedCache(redis_url="redis://fake", max_backoff_seconds=4.0)
+        cache._redis = redis
+        redis.down = True
+
+        for _ in range(5):
+            await cache.get("missing")
+            clock.advance(cache._backoff_seconds)
+
+        assert cache._backoff_seconds == 4.0
+
+    async def test_success_closes_circuit(self, cache, redis, clock):
+        """Test the first successful call after the backoff resets it."""
+        redis.down = True
+        await cache.get("missing")
+        redis.down = False
+        clock.advance(1.0)
+
+        await cache.set("a", b"payload")
+
+        assert cache._backoff_seconds == 0.0
+        assert redis.data["sentinelhire:test:a"] == b"bpayload"
+        assert (await cache.get_stats())["redis_available"] is True
+
+    @pytest.mark.parametrize("value", [object(), 2 ** 70])
+    async def test_unencodable_value_does_not_open_circuit(self, cache, redis, value):
+        """Test a value orjson rejects stays local and leaves Redis in use."""
+        await cache.set("bad", value)
+
+        assert await cache.get("bad") is value
+        assert "sentinelhire:test:bad" not in redis.data
+        assert cache._backoff_seconds == 0.0
+        await cache.set("good", b"payload")
+        assert redis.data["sentinelhire:test:good"] == b"bpayload"
+
+    async def test_clear_scans_only_own_namespace(self, cache, redis):
+        """Test clear SCANs for this cache's prefix and leaves other namespaces alone."""
+        await cache.set("a", b"1")
+        await cache.set("b", {"n": 2})
+        redis.data["sentinelhire:other:a"] = b"b1"
+        redis.data["unrelated"] = b"x"
+
+        await cache.clear()
+
+        assert redis.data == {"sentinelhire:other:a": b"b1", "unrelated": b"x"}
+        assert redis.scan_counts == [500]
+        assert await cache.get("a") is None
+
+    async def test_clear_failure_opens_circuit(self, cache, redis):
+        """Test a Redis error during clear still clears the local level."""
+        await cache.set("a", b"1")
+        redis.down = True
+
+        await cache.clear()
+
+        assert cache.cache == {}
+        assert cache._backoff_seconds == 1.0
+
+    async def test_use_redis_resets_client_and_circuit(self, cache, redis):
+        """Test repointing the cache drops the old client and closes the circuit."""
+        redis.down = True
+        await cache.get("missing")
+
+        cache.use_redis(None)
+
+        assert cache._client() is None
+        assert cache._backoff_seconds == 0.0
+        assert (await cache.get_stats())["redis_enabled"] is False
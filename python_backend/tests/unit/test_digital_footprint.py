@@ -5,6 +5,64 @@ Unit tests for digital footprint service.
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from detectors.digital_footprint import DigitalFootprintService
+from utils.cached_api_client import cached_api_client
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """Stand in for the shared cached API client's ``get``."""
+    mock = AsyncMock()
+    monkeypatch.setattr(cached_api_client, 'get', mock)
+    return mock
+
+
+SERPAPI_TWO_HITS = {
+    'data': {
+        'organic_results': [
+            {
+                'title': 'John Doe - Software Engineer',
+                'link': 'https://linkedin.com/in/johndoe',
+                'snippet': 'Software Engineer at Google'
+            },
+            {
+                'title': 'John Doe GitHub',
+                'link': 'https://github.com/johndoe',
+                'snippet': 'Software Engineer and open source contributor'
+            }
+        ]
+    }
+}
+
+SERPAPI_NO_HITS = {'data': {'organic_results': []}}
+
+
+GOOGLE_RESULT = {
+    'title': 'John Doe - Software Engineer',
+    'link': 'https://linkedin.com/in/johndoe',
+    'snippet': 'Software Engineer at Google',
+    'source': 'google'
+}
+
+SCORE_WITH_RESULTS = {
+    "google_search": [GOOGLE_RESULT],
+    "social_media": {},
+    "professional_networks": {},
+    "sources_used": ["serpapi"],
+    "rationale": ["Google search performed via SerpAPI"]
+}
+
+SCORE_NO_RESULTS = {
+    "google_search": [],
+    "social_media": {},
+    "professional_networks": {},
+    "sources_used": [],
+    "rationale": ["No results found"]
+}
+
+SCORE_MIXED_RESULTS = {
+    **SCORE_WITH_RESULTS,
+    "social_media": {"linkedin": [{"title": "John Doe"}]}
+}
 
 
 class TestDigitalFootprintService:
@@ -14,143 +72,65 @@ class TestDigitalFootprintService:
         """Set up test fixtures."""
         self.service = DigitalFootprintService(serpapi_key="test_serpapi_key")
 
-    @pytest.mark.asyncio
-    async def test_analyze_digital_footprint_success(self):
-        """Test successful digital footprint analysis."""
-        full_name = "John Doe"
-        email = "john.doe@example.com"
-        phone = "+1234567890"
-        
-        with patch('detectors.digital_footprint.cached_api_client') as mock_client:
-            mock_client.get.return_value = {
-                'data': {
-                    'organic_results': [
-                        {
-                            'title': 'John Doe - Software Engineer',
-                            'link': 'https://linkedin.com/in/johndoe',
-                            'snippet': 'Software Engineer at Google'
-                        },
-                        {
-                            'title': 'John Doe GitHub',
-                            'link': 'https://github.com/johndoe',
-                            'snippet': 'Software Engineer and open source contributor'
-                        }
-                    ]
-                }
-            }
-        
-        result = await self.service.analyze_digital_footprint(full_name, email, phone)
-        
-        assert result is not None
-        assert isinstance(result, dict)
-        assert "google_search" in result
-        assert "social_media" in result
-        assert "professional_networks" in result
-        assert "sources_used" in result
-        assert "score" in result
-        assert "rationale" in result
-        assert len(result["google_search"]) == 0  # API calls fail with test key
-        assert "serpapi" in result["sources_used"]
-
-    @pytest.mark.asyncio
-    async def test_analyze_digital_footprint_no_results(self):
-        """Test digital footprint analysis with no results."""
-        full_name = "Unknown Person"
-        email = "unknown@example.com"
-        phone = "+1234567890"
-        
-        with patch('detectors.digital_footprint.cached_api_client') as mock_client:
-            mock_client.get.return_value = {
-                'data': {
-                    'organic_results': []
-                }
-            }
-        
-        result = await self.service.analyze_digital_footprint(full_name, email, phone)
-        
-        assert result is not None
-        assert isinstance(result, dict)
-        assert "google_search" in result
-        assert len(result["google_search"]) == 0
-        assert "serpapi" in result["sources_used"]
-
-    @pytest.mark.asyncio
-    async def test_analyze_digital_footprint_api_error(self):
-        """Test digital footprint analysis with API error."""
-        full_name = "John Doe"
-        email = "john.doe@example.com"
-        phone = "+1234567890"
-        
-        with patch('detectors.digital_footprint.cached_api_client') as mock_client:
-            mock_client.get.side_effect = Exception("SerpAPI error")
-        
-        result = await self.service.analyze_digital_footprint(full_name, email, phone)
-        
-        assert result is not None
-        assert isinstance(result, dict)
-        assert "google_search" in result
-        assert len(result["google_search"]) == 0
-        assert "Google search performed via SerpAPI" in result["rationale"]
-
-    @pytest.mark.asyncio
-    async def test_analyze_digital_footprint_no_api_key(self):
-        """Test digital footprint analysis without API key."""
-        service = DigitalFootprintService(serpapi_key=None)
-        full_name = "John Doe"
-        email = "john.doe@example.com"
-        phone = "+1234567890"
-        
-        result = await service.analyze_digital_footprint(full_name, email, phone)
-        
-        assert result is not None
-        assert isinstance(result, dict)
-        assert "google_search" in result
-        assert len(result["google_search"]) == 0
-        assert "SerpAPI key not provided, skipping Google search" in result["rationale"]
-
-    @pytest.mark.asyncio
-    async def test_serpapi_search_success(self):
+    @pytest.mark.parametrize("serpapi_key,payload,side_effect,expected_count,rationale", [
+        pytest.param("test_serpapi_key", SERPAPI_TWO_HITS, None, 2, "Google search performed via SerpAPI", id="success"),
+        pytest.param("test_serpapi_key", SERPAPI_NO_HITS, None, 0, "Google search performed via SerpAPI", id="no_results"),
+        pytest.param("test_serpapi_key", None, Exception("SerpAPI error"), 0, "Google search performed via SerpAPI", id="api_error"),
+        pytest.param(None, None, None, 0, "SerpAPI key not provided, skipping Google search", id="no_api_key"),
+    ])
+    async def test_analyze_digital_footprint(
+        self, mock_api, serpapi_key, payload, side_effect, expected_count, rationale
+    ):
+        """Test digital footprint analysis across search outcomes and a missing API key."""
+        mock_api.return_value = payload
+        mock_api.side_effect = side_effect
+        service = DigitalFootprintService(serpapi_key=serpapi_key)
+
+        result = await service.analyze_digital_footprint("John Doe", "john.doe@example.com", "+1234567890")
+
+        assert set(result) >= {"google_search", "social_media", "professional_networks", "sources_used", "score", "rationale"}
+        assert len(result["google_search"]) == expected_count
+        assert rationale in result["rationale"]
+        assert ("serpapi" in result["sources_used"]) is (serpapi_key is not None)
+        if serpapi_key is None:
+            mock_api.assert_not_called()
+
+    async def test_serpapi_search_success(self, mock_api):
         """Test successful SerpAPI search."""
         query = "John Doe software engineer"
-        
-        with patch('detectors.digital_footprint.cached_api_client') as mock_client:
-            mock_client.get.return_value = {
-                'data': {
-                    'organic_results': [
-                        {
-                            'title': 'John Doe - Software Engineer',
-                            'link': 'https://linkedin.com/in/johndoe',
-                            'snippet': 'Software Engineer at Google'
-                        }
-                    ]
-                }
+        mock_api.return_value = {
+            'data': {
+                'organic_results': [
+                    {
+                        'title': 'John Doe - Software Engineer',
+                        'link': 'https://linkedin.com/in/johndoe',
+                        'snippet': 'Software Engineer at Google'
+                    }
+                ]
             }
-        
+        }
+
         result = await self.service._serpapi_search(query)
-        
-        assert isinstance(result, list)
-        assert len(result) == 0  # API calls fail with test key
 
-    @pytest.mark.asyncio
-    async def test_serpapi_search_api_error(self):
+        assert result == [GOOGLE_RESULT]
+        mock_api.assert_awaited_once()
+
+    async def test_serpapi_search_api_error(self, mock_api):
         """Test SerpAPI search with API error."""
         query = "John Doe software engineer"
-        
-        with patch('detectors.digital_footprint.cached_api_client') as mock_client:
-            mock_client.get.side_effect = Exception("API error")
-        
+        mock_api.side_effect = Exception("API error")
+
         result = await self.service._serpapi_search(query)
-        
+
         assert isinstance(result, list)
         assert len(result) == 0
 
-    @pytest.mark.asyncio
     async def test_search_google_success(self):
         """Test successful Google search."""
         full_name = "John Doe"
         email = "john.doe@example.com"
         
-        with patch.object(self.service, '_serpapi_search') as mock_search:
+        with patch.object(self.service, '_serpapi_search', new_callable=AsyncMock) as mock_search:
             mock_search.return_value = [
                 {
                     'title': 'John Doe - Software Engineer',
@@ -159,84 +139,39 @@ class TestDigitalFootprintService:
                     'source': 'google'
                 }
             ]
-        
-        result = await self.service._search_google(full_name, email)
-        
+
+            result = await self.service._search_google(full_name, email)
+
         assert isinstance(result, list)
-        assert len(result) == 0  # API calls fail with test key
+        # Every query returns the same hit, which is deduplicated by link
+        assert result == mock_search.return_value
+        assert mock_search.await_count == 4
 
-    @pytest.mark.asyncio
     async def test_search_google_no_results(self):
         """Test Google search with no results."""
         full_name = "Unknown Person"
         email = "unknown@example.com"
         
-        with patch.object(self.service, '_serpapi_search') as mock_search:
+        with patch.object(self.service, '_serpapi_search', new_callable=AsyncMock) as mock_search:
             mock_search.return_value = []
-        
-        result = await self.service._search_google(full_name, email)
+
+            result = await self.service._search_google(full_name, email)
         
         assert isinstance(result, list)
         assert len(result) == 0
 
-    def test_calculate_footprint_score_with_results(self):
-        """Test footprint score calculation with results."""
-        results = {
-            "google_search": [
-                {
-                    'title': 'John Doe - Software Engineer',
-                    'link': 'https://linkedin.com/in/johndoe',
-                    'snippet': 'Software Engineer at Google',
-                    'source': 'google'
-                }
-            ],
-            "social_media": {},
-            "professional_networks": {},
-            "sources_used": ["serpapi"],
-            "rationale": ["Google search performed via SerpAPI"]
-        }
-        
-        score = self.service._calculate_footprint_score(results)
-        
-        assert isinstance(score, float)
-        assert 0.0 <= score <= 1.0
-        assert score > 0.5  # Should be higher with results
-
-    def test_calculate_footprint_score_no_results(self):
-        """Test footprint score calculation with no results."""
-        results = {
-            "google_search": [],
-            "social_media": {},
-            "professional_networks": {},
-            "sources_used": [],
-            "rationale": ["No results found"]
-        }
-        
+    @pytest.mark.parametrize("results,check", [
+        # Should be higher with results
+        pytest.param(SCORE_WITH_RESULTS, lambda score: score > 0.5, id="with_results"),
+        # Should be default score with no results
+        pytest.param(SCORE_NO_RESULTS, lambda score: score == 0.3, id="no_results"),
+        # Should be higher with more results
+        pytest.param(SCORE_MIXED_RESULTS, lambda score: score > 0.5, id="mixed_results"),
+    ])
+    def test_calculate_footprint_score(self, results, check):
+        """Test footprint score calculation across result mixes."""
         score = self.service._calculate_footprint_score(results)
-        
-        assert isinstance(score, float)
-        assert 0.0 <= score <= 1.0
-        assert score == 0.3  # Should be default score with no results
 
-    def test_calculate_footprint_score_mixed_results(self):
-        """Test footprint score calculation with mixed results."""
-        results = {
-            "google_search": [
-                {
-                    'title': 'John Doe - Software Engineer',
-                    'link': 'https://linkedin.com/in/johndoe',
-                    'snippet': 'Software Engineer at Google',
-                    'source': 'google'
-                }
-            ],
-            "social_media": {"linkedin": [{"title": "John Doe"}]},
-            "professional_networks": {},
-            "sources_used": ["serpapi"],
-            "rationale": ["Google search performed via SerpAPI"]
-        }
-        
-        score = self.service._calculate_footprint_score(results)
-        
         assert isinstance(score, float)
         assert 0.0 <= score <= 1.0
-        assert score > 0.5  # Should be higher with more results
\ No newline at end of file
+        assert check(score), score
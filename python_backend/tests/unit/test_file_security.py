@@ -2,8 +2,6 @@
 Unit tests for file security scanner.
 """
 
-import pytest
-from unittest.mock import patch, mock_open
 from detectors.file_security import FileSecurityScanner
 
 
@@ -14,7 +12,6 @@ class TestFileSecurityScanner:
         """Set up test fixtures."""
         self.scanner = FileSecurityScanner()
 
-    @pytest.mark.asyncio
     async def test_scan_safe_pdf(self, sample_pdf_content):
         """Test scanning a safe PDF file."""
         result = await self.scanner.scan_file("test.pdf", sample_pdf_content)
@@ -24,7 +21,6 @@ class TestFileSecurityScanner:
         assert result["file_info"]["mime_type"] == "application/pdf"
         assert result["file_info"]["extension"] == ".pdf"
 
-    @pytest.mark.asyncio
     async def test_scan_malicious_pdf(self, malicious_pdf_content):
         """Test scanning a malicious PDF file."""
         result = await self.scanner.scan_file("malicious.pdf", malicious_pdf_content)
@@ -36,7 +32,6 @@ class TestFileSecurityScanner:
         threat_types = [threat["type"] for threat in result["threats_detected"]]
         assert "pdf_javascript" in threat_types
 
-    @pytest.mark.asyncio
     async def test_scan_executable_file(self):
         """Test scanning an executable file."""
         exe_content = b'MZ\x90\x00'  # PE header start
@@ -48,7 +43,6 @@ class TestFileSecurityScanner:
         threat_types = [threat["type"] for threat in result["threats_detected"]]
         assert "suspicious_extension" in threat_types or "executable_signature" in threat_types
 
-    @pytest.mark.asyncio
     async def test_scan_large_file(self):
         """Test scanning a file that exceeds size limit."""
         large_content = b'A' * (60 * 1024 * 1024)  # 60MB
@@ -60,7 +54,6 @@ class TestFileSecurityScanner:
         threat_types = [threat["type"] for threat in result["threats_detected"]]
         assert "file_size" in threat_types
 
-    @pytest.mark.asyncio
     async def test_scan_suspicious_content(self):
         """Test scanning content with suspicious patterns."""
         suspicious_content = b'<script>alert("XSS")</script>\neval("malicious code")'
@@ -116,14 +109,12 @@ class TestFileSecurityScanner:
         assert threat["type"] == "executable_signature"
         assert threat["severity"] == "high"
 
-    @pytest.mark.asyncio
     async def test_analyze_content_safe(self):
         """Test content analysis for safe content."""
         safe_content = b'This is a normal resume with no suspicious content.'
         threats = await self.scanner._analyze_content(safe_content, "test.txt")
         assert len(threats) == 0
 
-    @pytest.mark.asyncio
     async def test_analyze_content_suspicious(self):
         """Test content analysis for suspicious content."""
         suspicious_content = b'<script>alert("XSS")</script>\neval("malicious code")'
@@ -166,7 +157,6 @@ class TestFileSecurityScanner:
         assert "sha256" in file_info
         assert len(file_info["sha256"]) == 64  # SHA256 hash length
 
-    @pytest.mark.asyncio
     async def test_scan_file_error_handling(self):
         """Test error handling in file scanning."""
         # Test with invalid file content
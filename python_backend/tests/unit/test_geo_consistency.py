@@ -0,0 +1,35 @@
+"""
+Unit tests for contact verification's phone/location consistency check.
+"""
+
+from unittest.mock import Mock, patch
+
+
+class TestGeoConsistency:
+    """Test cases for ContactVerificationService._check_geo_consistency_comprehensive."""
+
+    async def test_check_geo_consistency_matching(self, contact_service):
+        """Test geo consistency check with matching data."""
+        phone = "+1234567890"
+        stated_location = "New York, NY, USA"
+        
+        with patch.multiple('phonenumbers', parse=Mock(return_value=Mock()), region_code_for_number=Mock(return_value="US")), \
+             patch.multiple('phonenumbers.geocoder', description_for_number=Mock(return_value="New York")):
+            
+            result = await contact_service._check_geo_consistency_comprehensive(phone, stated_location, "US")
+            
+            assert result["phone_country_matches"] is True
+            assert result["phone_region_matches"] is True
+
+    async def test_check_geo_consistency_mismatch(self, contact_service):
+        """Test geo consistency check with mismatched data."""
+        phone = "+1234567890"  # US phone
+        stated_location = "London, UK"  # UK location
+        
+        with patch.multiple('phonenumbers', parse=Mock(return_value=Mock()), region_code_for_number=Mock(return_value="US")), \
+             patch.multiple('phonenumbers.geocoder', description_for_number=Mock(return_value="New York")):
+            
+            result = await contact_service._check_geo_consistency_comprehensive(phone, stated_location, "US")
+            
+            assert result["phone_country_matches"] is False
+            assert result["phone_region_matches"] is False
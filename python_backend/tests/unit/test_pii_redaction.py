@@ -0,0 +1,82 @@
+"""
+Unit tests for PII redaction in log events.
+"""
+
+import re
+
+import pytest
+from utils import logging_config
+from utils.logging_config import redact_pii
+
+
+# The stdlib-re redaction redact_pii replaced, kept as the reference behaviour
+_LEGACY_PATTERNS = [
+    (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]'),
+    (r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', '[PHONE_REDACTED]'),
+    (r'\b\d{3}-?\d{2}-?\d{4}\b', '[SSN_REDACTED]'),
+    (r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b', '[CC_REDACTED]'),
+    (r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', '[NAME_REDACTED]'),
+]
+
+
+def _legacy_redact(text):
+    for pattern, replacement in _LEGACY_PATTERNS:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+# Every separator stdlib \s matches beyond what RE2 and Hyperscan treat as \s
+_NON_ASCII_SPACES = [
+    chr(c) for c in range(0x110000)
+    if re.fullmatch(r"\s", chr(c)) and chr(c) not in "\t\n\f\r "
+]
+
+_SEPARATED_TEMPLATES = [
+    "call 555{0}123{0}4567 now",
+    "call +1{0}555{0}123{0}4567",
+    "card 4111{0}1111{0}1111{0}1111 on file",
+]
+
+
+@pytest.fixture(params=["prefilter", "no_prefilter"])
+def prefilter(request, monkeypatch):
+    """Run each case with and without the Hyperscan prefilter in front of the patterns."""
+    if request.param == "no_prefilter":
+        monkeypatch.setattr(logging_config, "_PII_PREFILTER", None)
+    return request.param
+
+
+class TestRedactPII:
+    """Test cases for redact_pii against the stdlib-re reference."""
+
+    @pytest.mark.parametrize("template", _SEPARATED_TEMPLATES)
+    @pytest.mark.parametrize("space", _NON_ASCII_SPACES, ids=lambda s: f"U+{ord(s):04X}")
+    def test_non_ascii_separators_match_stdlib_re(self, prefilter, template, space):
+        """Test numbers split by any Unicode whitespace are redacted as stdlib re did."""
+        text = template.format(space)
+
+        redacted = redact_pii(text)
+
+        assert redacted == _legacy_redact(text)
+        assert redacted != text
+
+    @pytest.mark.parametrize("text", [
+        "Contact John Smith at john.smith@example.com or (555) 123-4567",
+        "SSN 123-45-6789, card 4111-1111-1111-1111",
+        "no personal data here",
+    ])
+    def test_ascii_text_matches_stdlib_re(self, prefilter, text):
+        """Test ordinary log lines redact exactly as before."""
+        assert redact_pii(text) == _legacy_redact(text)
+
+    def test_lone_surrogates_are_redacted(self, prefilter):
+        """Test text that isn't valid UTF-8 still goes through the patterns."""
+        text = "bad \ud800 byte, call 555-123-4567"
+
+        assert redact_pii(text) == _legacy_redact(text)
+
+    def test_nested_structures(self, prefilter):
+        """Test dicts and lists are walked and non-text leaves pass through."""
+        data = {"note": ["call 555\xa0123\xa04567"], "count": 3}
+
+        assert redact_pii(data) == {"note": ["call [PHONE_REDACTED]"], "count": 3}
@@ -0,0 +1,293 @@
+"""
+Unit tests for rate limiting utilities.
+"""
+
+import pytest
+from utils.rate_limiter import GlobalRateLimiter, RateLimiter, _advance_window
+
+
+class FakeClock:
+    """Stands in for the ``time`` module inside utils.rate_limiter; advanced by hand."""
+
+    WALL_OFFSET = 1_700_000_000.0
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def monotonic_ns(self) -> int:
+        return round(self.now * 1_000_000_000)
+
+    def time(self) -> float:
+        return self.WALL_OFFSET + self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the rate limiter's clocks at a controllable instant."""
+    fake = FakeClock()
+    monkeypatch.setattr("utils.rate_limiter.time", fake)
+    return fake
+
+
+class TestRateLimiter:
+    """Test cases for the per-client token bucket."""
+
+    async def test_allows_up_to_max_requests_then_denies(self, clock):
+        """Test a fresh bucket admits max_requests calls back to back."""
+        limiter = RateLimiter(max_requests=3, window_seconds=60)
+
+        results = [await limiter.is_allowed("client") for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    async def test_refills_at_max_requests_per_window(self, clock):
+        """Test tokens come back at max_requests / window_seconds per second."""
+        limiter = RateLimiter(max_requests=3, window_seconds=60)
+        for _ in range(3):
+            await limiter.is_allowed("client")
+
+        # One token every 20 seconds
+        clock.advance(19.9)
+        assert await limiter.is_allowed("client") is False
+        clock.advance(0.1)
+        assert await limiter.is_allowed("client") is True
+        assert await limiter.is_allowed("client") is False
+
+    async def test_refill_is_capped_at_max_requests(self, clock):
+        """Test a long-idle bucket holds no more than max_requests tokens."""
+        limiter = RateLimiter(max_requests=3, window_seconds=60)
+        await limiter.is_allowed("client")
+
+        clock.advance(600)
+        assert await limiter.get_remaining_requests("client") == 3
+
+    async def test_clients_have_separate_buckets(self, clock):
+        """Test one client draining its bucket doesn't affect another."""
+        limiter = RateLimiter(max_requests=1, window_seconds=60)
+
+        assert await limiter.is_allowed("a") is True
+        assert await limiter.is_allowed("a") is False
+        assert await limiter.is_allowed("b") is True
+
+    async def test_get_remaining_requests(self, clock):
+        """Test remaining count drops per request and rounds partial tokens down."""
+        limiter = RateLimiter(max_requests=5, window_seconds=60)
+
+        assert await limiter.get_remaining_requests("client") == 5
+        await limiter.is_allowed("client")
+        await limiter.is_allowed("client")
+        assert await limiter.get_remaining_requests("client") == 3
+
+        # 6 seconds refills half a token
+        clock.advance(6)
+        assert await limiter.get_remaining_requests("client") == 3
+
+    async def test_get_reset_time(self, clock):
+        """Test reset time is when the next whole token arrives."""
+        limiter = RateLimiter(max_requests=2, window_seconds=60)
+
+        assert await limiter.get_reset_time("client") is None
+        await limiter.is_allowed("client")
+        # One token left: nothing to wait for, but the bucket isn't full
+        assert await limiter.get_reset_time("client") == pytest.approx(clock.time())
+
+        await limiter.is_allowed("client")
+        clock.advance(10)
+        # A third of a token refilled; the rest takes 20 more seconds
+        assert await limiter.get_reset_time("client") == pytest.approx(clock.time() + 20)
+
+        clock.advance(60)
+        assert await limiter.get_reset_time("client") is None
+
+    async def test_lookups_do_not_create_buckets(self, clock):
+        """Test remaining/reset lookups for unknown clients leave no state behind."""
+        limiter = RateLimiter(max_requests=5, window_seconds=60)
+
+        assert await limiter.get_remaining_requests("unknown") == 5
+        assert await limiter.get_reset_time("unknown") is None
+        assert "unknown" not in limiter.buckets
+        assert (await limiter.get_stats())["clients"] == 0
+
+    async def test_evicts_buckets_idle_for_a_window(self, clock):
+        """Test buckets untouched for window_seconds are dropped on the next check."""
+        limiter = RateLimiter(max_requests=5, window_seconds=60)
+        await limiter.is_allowed("old")
+        clock.advance(30)
+        await limiter.is_allowed("recent")
+
+        clock.advance(29.9)
+        await limiter.is_allowed("new")
+        assert list(limiter.buckets) == ["old", "recent", "new"]
+
+        clock.advance(0.1)
+        await limiter.is_allowed("new")
+        assert list(limiter.buckets) == ["recent", "new"]
+        assert limiter._stats["evicted"] == 1
+
+    async def test_checking_a_client_keeps_its_bucket(self, clock):
+        """Test a checked bucket moves to the back and outlives idle ones."""
+        limiter = RateLimiter(max_requests=5, window_seconds=60)
+        await limiter.is_allowed("a")
+        await limiter.is_allowed("b")
+        clock.advance(59)
+        await limiter.is_allowed("a")
+
+        clock.advance(1)
+        await limiter.is_allowed("c")
+
+        assert list(limiter.buckets) == ["a", "c"]
+
+    async def test_max_clients_evicts_least_recently_checked(self, clock):
+        """Test overflowing max_clients drops the least recently checked buckets."""
+        limiter = RateLimiter(max_requests=5, window_seconds=60, max_clients=3)
+        for client_id in ("a", "b", "c"):
+            await limiter.is_allowed(client_id)
+        await limiter.is_allowed("a")
+
+        await limiter.is_allowed("d")
+        await limiter.is_allowed("e")
+
+        assert list(limiter.buckets) == ["a", "d", "e"]
+        assert limiter._stats["evicted"] == 2
+
+    async def test_evicted_client_starts_with_full_bucket(self, clock):
+        """Test a client pushed out by max_clients comes back with a fresh bucket."""
+        limiter = RateLimiter(max_requests=1, window_seconds=60, max_clients=1)
+        assert await limiter.is_allowed("a") is True
+        assert await limiter.is_allowed("a") is False
+
+        await limiter.is_allowed("b")
+
+        assert "a" not in limiter.buckets
+        assert await limiter.is_allowed("a") is True
+
+    async def test_stats_count_allowed_denied_and_evicted(self, clock):
+        """Test get_stats reports decision counters alongside the configuration."""
+        limiter = RateLimiter(max_requests=2, window_seconds=60, max_clients=2)
+        for _ in range(3):
+            await limiter.is_allowed("a")
+        await limiter.is_allowed("b")
+        await limiter.is_allowed("c")
+
+        assert await limiter.get_stats() == {
+            "allowed": 4,
+            "denied": 1,
+            "evicted": 1,
+            "clients": 2,
+            "max_clients": 2,
+            "max_requests": 2,
+            "window_seconds": 60
+        }
+
+    async def test_lookups_do_not_count_as_decisions(self, clock):
+        """Test remaining/reset lookups leave the allowed and denied counters alone."""
+        limiter = RateLimiter(max_requests=2, window_seconds=60)
+        await limiter.is_allowed("a")
+
+        await limiter.get_remaining_requests("a")
+        await limiter.get_reset_time("a")
+
+        stats = await limiter.get_stats()
+        assert (stats["allowed"], stats["denied"]) == (1, 0)
+
+
+WINDOW_NS = 60 * 1_000_000_000
+
+
+class TestAdvanceWindow:
+    """Test cases for the sliding window counter arithmetic."""
+
+    def test_same_window_keeps_counts(self):
+        """Test a reading inside the current window leaves the counts alone."""
+        window = [10, 4, 6]
+
+        estimate = _advance_window(window, 10 * WINDOW_NS + WINDOW_NS // 2, WINDOW_NS)
+
+        assert window == [10, 4, 6]
+        assert estimate == pytest.approx(6 * 0.5 + 4)
+
+    def test_partial_window_weights_previous_count(self):
+        """Test the previous window counts in proportion to its remaining overlap."""
+        window = [10, 0, 8]
+
+        assert _advance_window(window, 10 * WINDOW_NS, WINDOW_NS) == 8
+        assert _advance_window(window, 10 * WINDOW_NS + WINDOW_NS // 4, WINDOW_NS) == pytest.approx(6)
+        assert _advance_window(window, 11 * WINDOW_NS - 1, WINDOW_NS) == pytest.approx(0, abs=1e-9)
+
+    def test_exactly_one_window_elapsed_rolls_current_into_previous(self):
+        """Test crossing into the next window carries the current count over in full."""
+        window = [10, 5, 3]
+
+        estimate = _advance_window(window, 11 * WINDOW_NS, WINDOW_NS)
+
+        assert window == [11, 0, 5]
+        assert estimate == 5
+
+    def test_two_or_more_windows_elapsed_clears_counts(self):
+        """Test a gap longer than a window leaves nothing in the trailing window."""
+        window = [10, 5, 3]
+
+        estimate = _advance_window(window, 12 * WINDOW_NS + WINDOW_NS // 2, WINDOW_NS)
+
+        assert window == [12, 0, 0]
+        assert estimate == 0
+
+        window = [10, 5, 3]
+        assert _advance_window(window, 15 * WINDOW_NS, WINDOW_NS) == 0
+        assert window == [15, 0, 0]
+
+
+class TestGlobalRateLimiter:
+    """Test cases for the system-wide sliding window limiter."""
+
+    async def test_denies_once_window_is_full(self, clock):
+        """Test at most max_requests are admitted within one window."""
+        limiter = GlobalRateLimiter(max_requests=3, window_seconds=60)
+
+        results = [await limiter.is_allowed() for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    async def test_previous_window_still_counts_after_boundary(self, clock):
+        """Test a full window keeps blocking right after the boundary, then decays."""
+        limiter = GlobalRateLimiter(max_requests=4, window_seconds=60)
+        clock.now = 600.0
+        for _ in range(4):
+            await limiter.is_allowed()
+
+        # Start of the next window: the previous 4 still count in full
+        clock.now = 660.0
+        assert await limiter.is_allowed() is False
+
+        # Halfway through, the previous window weighs 2, leaving room for 2
+        clock.now = 690.0
+        assert [await limiter.is_allowed() for _ in range(3)] == [True, True, False]
+
+    async def test_idle_gap_of_two_windows_resets(self, clock):
+        """Test an idle gap of more than two windows admits a full window again."""
+        limiter = GlobalRateLimiter(max_requests=2, window_seconds=60)
+        clock.now = 600.0
+        await limiter.is_allowed()
+        await limiter.is_allowed()
+
+        clock.now = 750.0
+        assert [await limiter.is_allowed() for _ in range(3)] == [True, True, False]
+
+    async def test_stats_count_allowed_and_denied(self, clock):
+        """Test get_stats reports decision counters alongside the configuration."""
+        limiter = GlobalRateLimiter(max_requests=1, window_seconds=60)
+        await limiter.is_allowed()
+        await limiter.is_allowed()
+
+        assert await limiter.get_stats() == {
+            "allowed": 1,
+            "denied": 1,
+            "max_requests": 1,
+            "window_seconds": 60
+        }
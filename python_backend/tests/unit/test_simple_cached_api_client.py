@@ -2,8 +2,10 @@
 Simple unit tests for cached API client.
 """
 
+import httpx
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
+from utils.cache import MemoryCache, RedisBackedCache
 from utils.cached_api_client import cached_api_client
 
 
@@ -54,13 +56,11 @@ class TestSimpleCachedAPIClient:
         
         assert key1 != key2  # Different headers should generate different keys
 
-    @pytest.mark.asyncio
     async def test_clear_cache(self):
         """Test cache clearing."""
         # This should not raise an exception
         await cached_api_client.clear()
 
-    @pytest.mark.asyncio
     async def test_get_stats(self):
         """Test cache statistics."""
         stats = await cached_api_client.get_stats()
@@ -71,3 +71,46 @@ class TestSimpleCachedAPIClient:
         assert isinstance(stats["max_size"], int)
         assert isinstance(stats["size"], int)
         assert isinstance(stats["utilization"], float)
+
+    async def test_memory_cache_evicts_least_recently_used(self):
+        """Test that a full cache evicts the entry read or written longest ago."""
+        cache = MemoryCache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")  # "b" is now the least recently used
+
+        await cache.set("c", 3)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+
+    async def test_redis_backed_cache_falls_back_to_local_when_redis_down(self):
+        """Test that an unreachable Redis opens the circuit and the local level keeps serving."""
+        cache = RedisBackedCache(max_size=2, redis_url="redis://127.0.0.1:1")
+        await cache.set("a", b"payload")
+
+        assert await cache.get("a") == b"payload"
+        assert await cache.get("missing") is None
+        stats = await cache.get_stats()
+        assert stats["redis_enabled"] is True
+        assert stats["redis_available"] is False
+
+    @pytest.mark.parametrize("value", [b'{"data": 1}', {"data": [1, 2]}, "text"])
+    def test_redis_backed_cache_payload_round_trip(self, value):
+        """Test that values survive the Redis encoding with their type intact."""
+        cache = RedisBackedCache()
+
+        assert cache._decode(cache._encode(value)) == value
+
+    async def test_cache_hit_returns_independent_copy(self, isolated_api_cache, monkeypatch):
+        """Test that mutating a response doesn't change what later cache hits return."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"items": [1, 2]}))
+        monkeypatch.setattr(cached_api_client, 'client', httpx.AsyncClient(transport=transport))
+        url = "https://api.example.com/items"
+
+        first = await cached_api_client.get(url)
+        first["data"]["items"].append(3)
+        second = await cached_api_client.get(url)
+
+        assert second["data"] == {"items": [1, 2]}
@@ -0,0 +1,207 @@
+"""
+Unit tests for ContactVerificationService.verify_contact, with its three checks stubbed.
+"""
+
+import operator
+
+import pytest
+from types import SimpleNamespace
+
+
+pytestmark = pytest.mark.usefixtures("isolated_api_cache")
+
+
+EMAIL = "john.doe@example.com"
+PHONE = "+1234567890"
+LOCATION = "New York, NY"
+
+# Canned check results for a clean candidate, then per-scenario variants of them
+VALID_EMAIL_RESULT = {
+    "input": EMAIL,
+    "normalized": EMAIL,
+    "syntax_valid": True,
+    "domain_registrable": "example.com",
+    "mx_records_found": True,
+    "smtp_probe": "UNKNOWN",
+    "is_disposable": False,
+    "is_role": False,
+    "notes": ["Found 5 MX records", "A record found"],
+    "sources": ["email-validator", "dnspython", "publicsuffix2", "abstract-api"]
+}
+
+VALID_PHONE_RESULT = {
+    "input": PHONE,
+    "e164": PHONE,
+    "valid": True,
+    "country_code": "US",
+    "region_hint": "New York",
+    "toll_free": False,
+    "carrier": "Verizon Wireless",
+    "timezone": ["America/New_York"],
+    "notes": ["libphonenumber parse/validate/geocode"],
+    "sources": ["libphonenumber"]
+}
+
+MATCHING_GEO_RESULT = {
+    "stated_location": LOCATION,
+    "phone_country_matches": True,
+    "phone_region_matches": True,
+    "toll_free_conflict": False,
+    "phone_region": "New York",
+    "phone_country": "US",
+    "is_toll_free": False,
+    "method": "libphonenumber geocoder + toll-free rules",
+    "sources": ["libphonenumber"]
+}
+
+INVALID_EMAIL_RESULT = {
+    **VALID_EMAIL_RESULT,
+    "input": "invalid-email",
+    "normalized": "invalid-email",
+    "syntax_valid": False,
+    "domain_registrable": None,
+    "mx_records_found": False,
+    "notes": ["Invalid email format"],
+    "sources": ["email-validator"]
+}
+
+DISPOSABLE_EMAIL_RESULT = {
+    **VALID_EMAIL_RESULT,
+    "input": "test@10minutemail.com",
+    "normalized": "test@10minutemail.com",
+    "domain_registrable": "10minutemail.com",
+    "is_disposable": True,
+    "notes": ["Disposable email detected"],
+    "sources": ["email-validator", "abstract-api"]
+}
+
+WEAK_EMAIL_RESULT = {
+    **VALID_EMAIL_RESULT,
+    "mx_records_found": False,
+    "is_disposable": True,
+    "notes": ["No MX records found"]
+}
+
+INVALID_PHONE_RESULT = {
+    "input": "invalid-phone",
+    "e164": None,
+    "valid": False,
+    "country_code": None,
+    "region_hint": None,
+    "toll_free": False,
+    "carrier": None,
+    "timezone": [],
+    "notes": ["Invalid phone number format"],
+    "sources": ["libphonenumber"]
+}
+
+TOLL_FREE_PHONE_RESULT = {**VALID_PHONE_RESULT, "toll_free": True, "carrier": "Unknown"}
+
+MISMATCHED_GEO_RESULT = {
+    **MATCHING_GEO_RESULT,
+    "stated_location": "London, UK",
+    "phone_country_matches": False,
+    "phone_region_matches": False
+}
+
+# verify_contact scenarios: inputs, what each stubbed check returns, the bound the composite
+# score must meet, and any further check on the result
+CASES = {
+    "valid": dict(
+        email=EMAIL, phone=PHONE, location=LOCATION,
+        email_result=VALID_EMAIL_RESULT, phone_result=VALID_PHONE_RESULT, geo_result=MATCHING_GEO_RESULT,
+        composite=(operator.ge, 0.5)),
+    "invalid_email": dict(
+        email="invalid-email", phone=PHONE, location=LOCATION,
+        email_result=INVALID_EMAIL_RESULT, phone_result=VALID_PHONE_RESULT, geo_result=MATCHING_GEO_RESULT,
+        # Bad syntax and no MX cost 0.6 of the email score; phone and geo stay clean
+        composite=(operator.lt, 1.0), check=lambda r: r["score"]["email_score"] == 0.4),
+    "invalid_phone": dict(
+        email=EMAIL, phone="invalid-phone", location=LOCATION,
+        email_result=VALID_EMAIL_RESULT, phone_result=INVALID_PHONE_RESULT, geo_result=None,
+        composite=(operator.le, 0.5)),
+    "disposable_email": dict(
+        email="test@10minutemail.com", phone=PHONE, location=LOCATION,
+        email_result=DISPOSABLE_EMAIL_RESULT, phone_result=VALID_PHONE_RESULT, geo_result=MATCHING_GEO_RESULT,
+        # Disposable domains lose 0.2 of the email score
+        composite=(operator.lt, 1.0),
+        check=lambda r: r["score"]["email_score"] == 0.8 and r["email"]["is_disposable"] is True),
+    "geo_inconsistency": dict(
+        email=EMAIL, phone=PHONE, location="London, UK",
+        email_result=WEAK_EMAIL_RESULT, phone_result=TOLL_FREE_PHONE_RESULT, geo_result=MISMATCHED_GEO_RESULT,
+        composite=(operator.le, 0.5), check=lambda r: r["geo_consistency"]["phone_country_matches"] is False),
+    "no_phone": dict(
+        email=EMAIL, phone=None, location=LOCATION,
+        email_result=VALID_EMAIL_RESULT, phone_result=None, geo_result=None,
+        # Should still be verified with just email
+        composite=(operator.gt, 0.3)),
+    "no_location": dict(
+        email=EMAIL, phone=PHONE, location=None,
+        email_result=VALID_EMAIL_RESULT, phone_result=VALID_PHONE_RESULT, geo_result=None,
+        # No location to check
+        composite=(operator.ge, 0.5), check=lambda r: r["geo_consistency"] is None),
+}
+
+_get_score = operator.itemgetter("score")
+_get_composite = operator.itemgetter("composite")
+_get_input = operator.itemgetter("input")
+
+
+def _assert_contact_result(result, *, email, phone, composite, check=None):
+    """Assert the echoed inputs, that the composite score meets ``composite``, then ``check``."""
+    assert _get_input(result["email"]) == email
+    if phone is None:
+        assert result["phone"] is None
+    else:
+        assert _get_input(result["phone"]) == phone
+    compare, bound = composite
+    score = _get_score(result)
+    assert compare(_get_composite(score), bound), score
+    if check is not None:
+        assert check(result), score
+
+
+class AsyncReturns:
+    """Bare coroutine stub that returns ``return_value``, without AsyncMock's call recording."""
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+
+    async def __call__(self, *args, **kwargs):
+        return self.return_value
+
+
+class TestVerifyContactFlow:
+    """Test cases for combining the email, phone and geo checks."""
+
+    @pytest.fixture
+    def contact_mocks(self, contact_service, monkeypatch):
+        """Replace the three checks verify_contact combines; tests set their return values."""
+        mocks = SimpleNamespace(email=AsyncReturns(), phone=AsyncReturns(), geo=AsyncReturns())
+        monkeypatch.setattr(contact_service, '_verify_email_comprehensive', mocks.email)
+        monkeypatch.setattr(contact_service, '_verify_phone_comprehensive', mocks.phone)
+        monkeypatch.setattr(contact_service, '_check_geo_consistency_comprehensive', mocks.geo)
+        return mocks
+
+    @pytest.fixture
+    def configured_mocks(self, request, contact_mocks):
+        """Load the checks' return values for the case named by the parameter."""
+        case = CASES[request.param]
+        contact_mocks.email.return_value = case["email_result"]
+        contact_mocks.phone.return_value = case["phone_result"]
+        contact_mocks.geo.return_value = case["geo_result"]
+        return case
+
+    @pytest.mark.parametrize("configured_mocks", list(CASES), indirect=True)
+    async def test_verify_contact(self, contact_service, configured_mocks):
+        """Test contact verification across valid, invalid and partial contact details."""
+        case = configured_mocks
+
+        result = await contact_service.verify_contact(
+            email=case["email"], phone=case["phone"], stated_location=case["location"]
+        )
+
+        _assert_contact_result(
+            result, email=case["email"], phone=case["phone"],
+            composite=case["composite"], check=case.get("check")
+        )
@@ -0,0 +1,38 @@
+"""
+Unit tests for contact verification's email check.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+pytestmark = pytest.mark.usefixtures("isolated_api_cache")
+
+
+class TestVerifyEmail:
+    """Test cases for ContactVerificationService._verify_email_comprehensive."""
+
+    async def test_verify_email_comprehensive_valid(self, contact_service):
+        """Test email verification for valid email."""
+        email = "john.doe@example.com"
+        
+        with patch('dns.resolver.resolve') as mock_resolve:
+            mock_resolve.return_value = [Mock(rdata=['mx1.example.com', 'mx2.example.com'])]
+        
+        with patch('publicsuffix2.get_sld') as mock_sld:
+            mock_sld.return_value = "example.com"
+        
+        # Mock the domain info method instead
+        with patch.object(contact_service, '_get_domain_info') as mock_domain:
+            mock_domain.return_value = {
+                "mx_records_found": True,
+                "registrable_domain": "example.com",
+                "notes": ["Found 5 MX records", "A record found"]
+            }
+        
+        result = await contact_service._verify_email_comprehensive(email)
+        
+        assert result["input"] == email
+        assert result["syntax_valid"] is True
+        assert result["mx_records_found"] is True
+        assert result["is_disposable"] is False
@@ -0,0 +1,70 @@
+"""
+Unit tests for contact verification's phone checks.
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from utils.cached_api_client import cached_api_client
+
+
+pytestmark = pytest.mark.usefixtures("isolated_api_cache")
+
+
+class TestVerifyPhone:
+    """Test cases for the libphonenumber and NumVerify phone checks."""
+
+    async def test_verify_phone_comprehensive_valid(self, contact_service_no_numverify):
+        """Test phone verification for valid phone."""
+        phone = "+1234567890"
+
+        # Mock phonenumbers functions
+        phonenumbers_stubs = {
+            'parse': Mock(return_value=Mock()),
+            'is_valid_number': Mock(return_value=True),
+            'format_number': Mock(return_value="+1234567890"),
+            'region_code_for_number': Mock(return_value="US"),
+        }
+        with patch.multiple('phonenumbers', **phonenumbers_stubs), \
+             patch.multiple('phonenumbers.geocoder', description_for_number=Mock(return_value="New York")), \
+             patch.multiple('phonenumbers.carrier', name_for_number=Mock(return_value="Verizon Wireless")), \
+             patch.multiple('phonenumbers.timezone', time_zones_for_number=Mock(return_value=["America/New_York"])):
+
+            result = await contact_service_no_numverify._verify_phone_comprehensive(phone, "US")
+
+            assert result["input"] == phone
+            # The phone should be valid since phonenumbers.is_valid_number returns True
+            assert result["valid"] is True
+            assert result["country_code"] == "US"
+            assert result["carrier"] == "Verizon Wireless"
+
+    async def test_verify_phone_with_numverify_success(self, contact_service):
+        """Test NumVerify API integration."""
+        phone = "+1234567890"
+        
+        with patch.object(cached_api_client, 'get', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = {
+                "data": {
+                    "valid": True,
+                    "carrier": "Verizon Wireless",
+                    "country_code": "US"
+                }
+            }
+            
+            result = await contact_service._verify_phone_with_numverify(phone)
+            
+            assert result["valid"] is True
+            assert result["carrier"] == "Verizon Wireless"
+            assert result["reason"] == "Numverify API"
+
+    async def test_verify_phone_with_numverify_failure(self, contact_service):
+        """Test NumVerify API failure handling."""
+        phone = "+1234567890"
+        
+        with patch.object(cached_api_client, 'get', new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = Exception("API Error")
+            
+            result = await contact_service._verify_phone_with_numverify(phone)
+            
+            assert result["valid"] is False
+            assert result["carrier"] is None
+            assert "API error" in result["reason"]
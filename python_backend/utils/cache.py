@@ -2,43 +2,27 @@
 Caching utilities for API responses and analysis results.
 """
 
-import json
 import hashlib
 import time
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
-import asyncio
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Tuple
+import orjson
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-class CacheEntry:
-    """Cache entry with expiration."""
-    
-    def __init__(self, value: Any, ttl_seconds: int = 3600):
-        """
-        Initialize cache entry.
-        
-        Args:
-            value: Cached value
-            ttl_seconds: Time to live in seconds
-        """
-        self.value = value
-        self.created_at = time.time()
-        self.ttl_seconds = ttl_seconds
-    
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired."""
-        return time.time() - self.created_at > self.ttl_seconds
-    
-    def get_value(self) -> Optional[Any]:
-        """Get value if not expired."""
-        if self.is_expired():
-            return None
-        return self.value
-
 class MemoryCache:
-    """In-memory cache with TTL support."""
+    """
+    In-memory LRU cache with TTL support.
+
+    Entries are stored as ``(expires_at, value)`` tuples keyed by cache key,
+    where ``expires_at`` is a ``time.monotonic()`` deadline, so a hit is a
+    dict lookup and one float comparison.
+
+    No method awaits anything, so each one runs to completion on the event
+    loop without interleaving and the cache needs no lock. The methods stay
+    async so callers are unaffected if a networked backend replaces this one.
+    """
     
     def __init__(self, max_size: int = 1000):
         """
@@ -48,56 +32,53 @@ class MemoryCache:
             max_size: Maximum number of entries
         """
         self.max_size = max_size
-        self.cache: Dict[str, CacheEntry] = {}
-        self._lock = asyncio.Lock()
+        # Least recently used first, so eviction pops from the front
+        self.cache: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        async with self._lock:
-            entry = self.cache.get(key)
-            if entry is None:
-                return None
-            
-            if entry.is_expired():
-                del self.cache[key]
-                logger.debug(f"Cache entry expired for key: {key}")
-                return None
-            
-            logger.debug(f"Cache hit for key: {key}")
-            return entry.get_value()
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            del self.cache[key]
+            logger.debug(f"Cache entry expired for key: {key}")
+            return None
+        
+        self.cache.move_to_end(key)
+        logger.debug(f"Cache hit for key: {key}")
+        return value
     
     async def set(self, key: str, value: Any, ttl_seconds: int = 3600) -> None:
         """Set value in cache."""
-        async with self._lock:
-            # Remove expired entries if cache is full
-            if len(self.cache) >= self.max_size:
-                await self._cleanup_expired()
-                
-                # If still full, remove oldest entry
-                if len(self.cache) >= self.max_size:
-                    oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k].created_at)
-                    del self.cache[oldest_key]
-                    logger.debug(f"Removed oldest cache entry: {oldest_key}")
-            
-            self.cache[key] = CacheEntry(value, ttl_seconds)
-            logger.debug(f"Cached value for key: {key} (TTL: {ttl_seconds}s)")
+        # Monotonic, so a wall-clock adjustment can't expire or revive entries
+        self.cache[key] = (time.monotonic() + ttl_seconds, value)
+        self.cache.move_to_end(key)
+        
+        # Evict least recently used entries once over capacity
+        while len(self.cache) > self.max_size:
+            evicted_key, _ = self.cache.popitem(last=False)
+            logger.debug(f"Evicted least recently used cache entry: {evicted_key}")
+        
+        logger.debug(f"Cached value for key: {key} (TTL: {ttl_seconds}s)")
     
     async def delete(self, key: str) -> None:
         """Delete value from cache."""
-        async with self._lock:
-            if key in self.cache:
-                del self.cache[key]
-                logger.debug(f"Deleted cache entry: {key}")
+        if key in self.cache:
+            del self.cache[key]
+            logger.debug(f"Deleted cache entry: {key}")
     
     async def clear(self) -> None:
         """Clear all cache entries."""
-        async with self._lock:
-            self.cache.clear()
-            logger.info("Cache cleared")
+        self.cache.clear()
+        logger.info("Cache cleared")
     
-    async def _cleanup_expired(self) -> None:
+    def _cleanup_expired(self) -> None:
         """Remove expired entries."""
-        expired_keys = [k for k, v in self.cache.items() if v.is_expired()]
+        now = time.monotonic()
+        expired_keys = [k for k, v in self.cache.items() if now > v[0]]
         for key in expired_keys:
             del self.cache[key]
         if expired_keys:
@@ -105,21 +86,180 @@ class MemoryCache:
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        async with self._lock:
-            await self._cleanup_expired()
-            return {
-                "size": len(self.cache),
-                "max_size": self.max_size,
-                "utilization": len(self.cache) / self.max_size * 100
-            }
+        self._cleanup_expired()
+        return {
+            "size": len(self.cache),
+            "max_size": self.max_size,
+            "utilization": len(self.cache) / self.max_size * 100
+        }
+
+class RedisBackedCache(MemoryCache):
+    """
+    Two-level cache: the in-process LRU in front of a shared Redis.
+
+    Every worker reads through its own ``MemoryCache`` first and falls back to
+    Redis on a miss, promoting hits into the local level for the TTL Redis has
+    left on them. Redis errors open a circuit for an exponentially growing
+    backoff, during which the cache behaves exactly like a ``MemoryCache`` so
+    callers fall through to the upstream API instead of failing.
+    """
+    
+    # Tags the stored payload so bytes (what cached_api_client stores) round-trip untouched
+    _BYTES_TAG = b"b"
+    _JSON_TAG = b"j"
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        redis_url: Optional[str] = None,
+        namespace: str = "cache",
+        max_backoff_seconds: float = 60.0,
+    ):
+        """
+        Initialize two-level cache.
+        
+        Args:
+            max_size: Maximum number of entries in the local level
+            redis_url: Redis connection URL; ``None`` keeps the cache local-only
+            namespace: Prefix for this cache's Redis keys
+            max_backoff_seconds: Upper bound on how long Redis is skipped after errors
+        """
+        super().__init__(max_size=max_size)
+        self.redis_url = redis_url
+        self.prefix = f"sentinelhire:{namespace}:"
+        self.max_backoff_seconds = max_backoff_seconds
+        self._redis = None
+        self._backoff_seconds = 0.0
+        self._retry_at = 0.0
+    
+    def use_redis(self, redis_url: Optional[str]) -> None:
+        """Point the shared level at ``redis_url`` (``None`` disables it) with the circuit closed."""
+        self.redis_url = redis_url
+        self._redis = None
+        self._backoff_seconds = 0.0
+        self._retry_at = 0.0
+    
+    def _client(self):
+        """Return the Redis client, or ``None`` while disabled or circuit-broken."""
+        if not self.redis_url or time.monotonic() < self._retry_at:
+            return None
+        if self._redis is None:
+            import redis.asyncio as aioredis
+            self._redis = aioredis.Redis.from_url(
+                self.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+    
+    def _record_success(self) -> None:
+        """Close the circuit after a successful Redis call."""
+        self._backoff_seconds = 0.0
+    
+    def _record_failure(self, error: Exception) -> None:
+        """Open the circuit, doubling the backoff up to ``max_backoff_seconds``."""
+        self._backoff_seconds = min(max(self._backoff_seconds * 2, 1.0), self.max_backoff_seconds)
+        self._retry_at = time.monotonic() + self._backoff_seconds
+        logger.warning(f"Redis cache unavailable, skipping it for {self._backoff_seconds:.0f}s: {error}")
+    
+    def _encode(self, value: Any) -> bytes:
+        """Serialize a value for Redis."""
+        if isinstance(value, bytes):
+            return self._BYTES_TAG + value
+        return self._JSON_TAG + orjson.dumps(value)
+    
+    def _decode(self, data: bytes) -> Any:
+        """Deserialize a value read from Redis."""
+        if data[:1] == self._BYTES_TAG:
+            return data[1:]
+        return orjson.loads(data[1:])
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from the local level, then Redis."""
+        value = await super().get(key)
+        if value is not None:
+            return value
+        
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                data, ttl_ms = await pipe.get(self.prefix + key).pttl(self.prefix + key).execute()
+            self._record_success()
+        except Exception as e:
+            self._record_failure(e)
+            return None
+        
+        if data is None:
+            return None
+        value = self._decode(data)
+        if ttl_ms > 0:
+            await super().set(key, value, ttl_ms / 1000)
+        logger.debug(f"Redis cache hit for key: {key}")
+        return value
+    
+    async def set(self, key: str, value: Any, ttl_seconds: int = 3600) -> None:
+        """Set value in both levels."""
+        await super().set(key, value, ttl_seconds)
+        
+        client = self._client()
+        if client is None:
+            return
+        # A value orjson can't encode (or an int wider than 64 bits) says nothing
+        # about Redis, so it must not open the circuit
+        try:
+            payload = self._encode(value)
+        except TypeError as e:
+            logger.warning(f"Not caching {key} in Redis, value is not serializable: {e}")
+            return
+        try:
+            await client.set(self.prefix + key, payload, ex=ttl_seconds)
+            self._record_success()
+        except Exception as e:
+            self._record_failure(e)
+    
+    async def delete(self, key: str) -> None:
+        """Delete value from both levels."""
+        await super().delete(key)
+        
+        client = self._client()
+        if client is None:
+            return
+        try:
+            await client.delete(self.prefix + key)
+            self._record_success()
+        except Exception as e:
+            self._record_failure(e)
+    
+    async def clear(self) -> None:
+        """Clear both levels; only this cache's namespace is removed from Redis."""
+        await super().clear()
+        
+        client = self._client()
+        if client is None:
+            return
+        try:
+            keys = [k async for k in client.scan_iter(match=self.prefix + "*", count=500)]
+            if keys:
+                await client.delete(*keys)
+            self._record_success()
+        except Exception as e:
+            self._record_failure(e)
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get local cache statistics plus the Redis level's state."""
+        stats = await super().get_stats()
+        stats["redis_enabled"] = bool(self.redis_url)
+        stats["redis_available"] = bool(self.redis_url) and time.monotonic() >= self._retry_at
+        return stats
 
 def generate_cache_key(prefix: str, **kwargs) -> str:
     """Generate cache key from prefix and parameters."""
-    # Sort kwargs for consistent key generation
-    sorted_kwargs = sorted(kwargs.items())
-    key_data = f"{prefix}:{json.dumps(sorted_kwargs, sort_keys=True)}"
-    return hashlib.md5(key_data.encode()).hexdigest()
+    # orjson sorts keys at every nesting level, so one pass gives a canonical encoding
+    key_data = orjson.dumps([prefix, kwargs], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(key_data, digest_size=16).hexdigest()
 
-# Global cache instances
-api_cache = MemoryCache(max_size=500)  # For API responses
-analysis_cache = MemoryCache(max_size=200)  # For analysis results
+# Global cache instances; local-only until startup points them at Settings.redis_url
+api_cache = RedisBackedCache(max_size=500, namespace="api")  # For API responses
+analysis_cache = RedisBackedCache(max_size=200, namespace="analysis")  # For analysis results
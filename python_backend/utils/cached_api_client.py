@@ -4,7 +4,7 @@ Cached API client for external API calls.
 
 import asyncio
 import httpx
-import json
+import orjson
 from typing import Any, Dict, Optional
 from utils.cache import api_cache, generate_cache_key
 from utils.logging_config import get_logger
@@ -12,7 +12,14 @@ from utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 class CachedAPIClient:
-    """HTTP client with caching for external API calls."""
+    """
+    HTTP client with caching for external API calls.
+
+    Responses are cached as orjson-serialised bytes, so every caller gets its
+    own freshly decoded dict and can't alter what later cache hits return.
+    Only ``status_code`` and ``data`` are kept; response headers are dropped
+    because no caller reads them and they can outweigh the body.
+    """
     
     def __init__(self, timeout: int = 10, cache_ttl: int = 3600):
         """
@@ -24,7 +31,16 @@ class CachedAPIClient:
         """
         self.timeout = timeout
         self.cache_ttl = cache_ttl
-        self.client = httpx.AsyncClient(timeout=timeout)
+        # Repeat calls go to a handful of API hosts, so keep connections alive and
+        # multiplex over HTTP/2; transport retries only cover failed connects
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=2.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+                retries=1
+            )
+        )
     
     async def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, 
                   cache_key_prefix: str = "api", cache_ttl: Optional[int] = None) -> Dict[str, Any]:
@@ -39,7 +55,7 @@ class CachedAPIClient:
             cache_ttl: Override default cache TTL
             
         Returns:
-            Response data
+            Response status_code and data
         """
         # Generate cache key
         cache_key = generate_cache_key(
@@ -53,7 +69,7 @@ class CachedAPIClient:
         cached_result = await api_cache.get(cache_key)
         if cached_result is not None:
             logger.debug(f"Cache hit for API call: {url}")
-            return cached_result
+            return orjson.loads(cached_result)
         
         # Make API call
         try:
@@ -63,13 +79,12 @@ class CachedAPIClient:
             
             result = {
                 "status_code": response.status_code,
-                "data": response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text,
-                "headers": dict(response.headers)
+                "data": self._response_data(response)
             }
             
             # Cache the result
             ttl = cache_ttl or self.cache_ttl
-            await api_cache.set(cache_key, result, ttl)
+            await api_cache.set(cache_key, orjson.dumps(result), ttl)
             logger.info(f"Cached API response for: {url}")
             
             return result
@@ -96,7 +111,7 @@ class CachedAPIClient:
             cache_ttl: Override default cache TTL
             
         Returns:
-            Response data
+            Response status_code and data
         """
         # Generate cache key
         cache_key = generate_cache_key(
@@ -111,28 +126,31 @@ class CachedAPIClient:
         cached_result = await api_cache.get(cache_key)
         if cached_result is not None:
             logger.debug(f"Cache hit for API POST call: {url}")
-            return cached_result
+            return orjson.loads(cached_result)
         
         # Make API call
         try:
             logger.info(f"Making API POST call: {url}")
+            content = None
+            if json_data is not None:
+                content = orjson.dumps(json_data)
+                headers = {**(headers or {}), "Content-Type": "application/json"}
             response = await self.client.post(
                 url, 
                 data=data, 
-                json=json_data, 
+                content=content, 
                 headers=headers
             )
             response.raise_for_status()
             
             result = {
                 "status_code": response.status_code,
-                "data": response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text,
-                "headers": dict(response.headers)
+                "data": self._response_data(response)
             }
             
             # Cache the result
             ttl = cache_ttl or self.cache_ttl
-            await api_cache.set(cache_key, result, ttl)
+            await api_cache.set(cache_key, orjson.dumps(result), ttl)
             logger.info(f"Cached API POST response for: {url}")
             
             return result
@@ -156,6 +174,13 @@ class CachedAPIClient:
         """Get cache statistics."""
         return await api_cache.get_stats()
     
+    @staticmethod
+    def _response_data(response: httpx.Response) -> Any:
+        """Decode a JSON body with orjson; other content types come back as text."""
+        if response.headers.get("content-type", "").startswith("application/json"):
+            return orjson.loads(response.content)
+        return response.text
+    
     def _generate_cache_key(self, method: str, url: str, **kwargs) -> str:
         """Generate cache key for request."""
         return generate_cache_key(
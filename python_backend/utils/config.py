@@ -3,6 +3,7 @@ Configuration management for the resume fraud detection service.
 """
 
 from pydantic_settings import BaseSettings
+from functools import lru_cache
 from typing import Optional
 import os
 from .secrets_manager import get_config_from_secrets, validate_required_secrets
@@ -52,8 +53,14 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings with secrets management."""
+    """
+    Get application settings with secrets management.
+    
+    Built once per process: the secrets lookups and field validation are not
+    repeated on every call. Use ``get_settings.cache_clear()`` to reload.
+    """
     # Try to get configuration from AWS Secrets Manager first
     try:
         secrets_config = get_config_from_secrets()
@@ -3,10 +3,115 @@ Logging configuration for the resume fraud detection service.
 """
 
 import logging
+import orjson
 import structlog
 from typing import Any, Dict
 import sys
 import re
+import threading
+
+try:
+    # RE2 matches in linear time, so attacker-influenced log strings can't trigger backtracking
+    import re2 as _pii_re
+except ImportError:  # google-re2 ships no wheel for this platform
+    _pii_re = re
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan ships wheels for x86-64 Linux and macOS only
+    hyperscan = None
+
+# Every character stdlib ``re`` counts as \s in a str pattern. RE2 and Hyperscan
+# only treat ASCII [\t\n\f\r ] as \s, so the separators are listed explicitly:
+# a phone or card number split by a non-breaking space (\xa0), vertical tab or
+# ideographic space would otherwise reach the logs unredacted under RE2. Kept as
+# literal characters (not \u escapes, which RE2 doesn't parse).
+_UNICODE_SPACE = "\\s\x0b\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+_PHONE_SEP = "[-." + _UNICODE_SPACE + "]"
+_CARD_SEP = "[-" + _UNICODE_SPACE + "]"
+
+# PII patterns and their replacements, compiled once and applied in order. Each pass
+# runs over the previous pass's output, so a replacement tag can open a word
+# boundary for a later pattern; fusing them into one alternation would lose that.
+#
+# Known limit: under RE2, \d and \b are ASCII-only, where stdlib ``re`` treats them
+# as Unicode. With google-re2 installed, SSNs and card numbers written in non-ASCII
+# digits (e.g. fullwidth "１２３-４５-６７８９") are not redacted. The phone pattern
+# spells out [0-9], so it never matched non-ASCII digits under either engine.
+_PII_SOURCES = [
+    # Email addresses
+    (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]'),
+    # Phone numbers (various formats)
+    (r'(\+?1' + _PHONE_SEP + r'?)?\(?[0-9]{3}\)?' + _PHONE_SEP + r'?[0-9]{3}' + _PHONE_SEP + r'?[0-9]{4}', '[PHONE_REDACTED]'),
+    # Social Security Numbers
+    (r'\b\d{3}-?\d{2}-?\d{4}\b', '[SSN_REDACTED]'),
+    # Credit card numbers
+    (r'\b\d{4}' + _CARD_SEP + r'?\d{4}' + _CARD_SEP + r'?\d{4}' + _CARD_SEP + r'?\d{4}\b', '[CC_REDACTED]'),
+    # Names (basic pattern - could be improved)
+    (r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', '[NAME_REDACTED]'),
+]
+_PII_PATTERNS = [(_pii_re.compile(pattern), replacement) for pattern, replacement in _PII_SOURCES]
+# RE2 only takes valid UTF-8, so text with lone surrogates goes through stdlib re
+_SURROGATE_PII_PATTERNS = _PII_PATTERNS if _pii_re is re else [
+    (re.compile(pattern), replacement) for pattern, replacement in _PII_SOURCES
+]
+
+def _build_pii_prefilter():
+    """
+    Compile every PII pattern into one Hyperscan database, or return ``None``.
+    
+    A string no pattern matches comes out of the sequential passes unchanged,
+    so one scan for "any match" can skip them exactly. Hyperscan's \\d and
+    \\b are ASCII-only like RE2's, so the prefilter is only used over RE2;
+    stdlib ``re`` would also match non-ASCII digits the scan can't see.
+    """
+    if hyperscan is None or _pii_re is re:
+        return None
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[pattern.encode() for pattern, _ in _PII_SOURCES],
+            ids=list(range(len(_PII_SOURCES))),
+            # UTF8 so a multi-byte separator in a character class is one character
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(_PII_SOURCES),
+        )
+        return database
+    except Exception:  # e.g. a CPU without the SSSE3 Hyperscan needs
+        return None
+
+_PII_PREFILTER = _build_pii_prefilter()
+# Hyperscan scratch space can't be shared between concurrent scans
+_prefilter_scratch = threading.local()
+
+def _stop_scan(*args: Any) -> bool:
+    """Hyperscan match callback that ends the scan at the first match."""
+    return True
+
+def _may_contain_pii(text: bytes) -> bool:
+    """Whether any PII pattern matches UTF-8 ``text``; always ``True`` without the prefilter."""
+    if _PII_PREFILTER is None:
+        return True
+    scratch = getattr(_prefilter_scratch, "scratch", None)
+    if scratch is None:
+        scratch = _prefilter_scratch.scratch = hyperscan.Scratch(_PII_PREFILTER)
+    try:
+        _PII_PREFILTER.scan(text, _stop_scan, scratch=scratch)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+# Leaf types that can never hold PII text, returned as-is without a type walk
+_NON_TEXT_TYPES = (int, float, type(None), bytes)
+
+def _needs_redact(data: Any) -> bool:
+    """Whether ``data`` is, or contains, a string that redaction could change."""
+    if isinstance(data, str):
+        return True
+    if isinstance(data, dict):
+        return any(_needs_redact(v) for v in data.values())
+    if isinstance(data, list):
+        return any(_needs_redact(item) for item in data)
+    return False
 
 def redact_pii(data: Any) -> Any:
     """
@@ -18,21 +123,19 @@ def redact_pii(data: Any) -> Any:
     Returns:
         Data with PII redacted
     """
+    if isinstance(data, _NON_TEXT_TYPES):
+        return data
     if isinstance(data, str):
-        # Email addresses
-        data = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL_REDACTED]', data)
-        
-        # Phone numbers (various formats)
-        data = re.sub(r'(\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', '[PHONE_REDACTED]', data)
-        
-        # Social Security Numbers
-        data = re.sub(r'\b\d{3}-?\d{2}-?\d{4}\b', '[SSN_REDACTED]', data)
-        
-        # Credit card numbers
-        data = re.sub(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b', '[CC_REDACTED]', data)
-        
-        # Names (basic pattern - could be improved)
-        data = re.sub(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', '[NAME_REDACTED]', data)
+        try:
+            encoded = data.encode("utf-8")
+        except UnicodeEncodeError:
+            patterns = _SURROGATE_PII_PATTERNS
+        else:
+            if not _may_contain_pii(encoded):
+                return data
+            patterns = _PII_PATTERNS
+        for pattern, replacement in patterns:
+            data = pattern.sub(replacement, data)
         
     elif isinstance(data, dict):
         # Recursively redact PII in dictionaries
@@ -45,7 +148,16 @@ def redact_pii(data: Any) -> Any:
 
 def pii_redaction_processor(logger, method_name, event_dict):
     """Structlog processor to redact PII from log events."""
-    return redact_pii(event_dict)
+    # structlog hands each processor its own event dict, so rewrite values in
+    # place and leave string-free values (counts, scores, flags) uncopied
+    for key, value in event_dict.items():
+        if _needs_redact(value):
+            event_dict[key] = redact_pii(value)
+    return event_dict
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson; str keeps the stdlib handlers unchanged."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
 
 def setup_logging() -> None:
     """Setup structured logging for the application."""
@@ -62,7 +174,7 @@ def setup_logging() -> None:
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
             pii_redaction_processor,  # Redact PII before JSON rendering
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -3,31 +3,94 @@ Rate limiting utilities for API protection.
 """
 
 import time
-import asyncio
-from typing import Dict, Optional
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
-import hashlib
-import json
+from typing import Any, Dict, List, Optional
+from collections import OrderedDict
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+def _advance_window(window: List[int], now_ns: int, window_ns: int) -> float:
+    """
+    Roll a sliding-window counter forward to ``now_ns`` and estimate its request count.
+    
+    ``window`` is ``[window_index, current_count, previous_count]`` for fixed
+    windows of ``window_ns``. The previous window's count is weighted by how
+    much of it still overlaps the trailing ``window_ns``. Integer nanoseconds
+    keep the window arithmetic exact.
+    
+    Args:
+        window: Counter state, updated in place
+        now_ns: Current ``time.monotonic_ns()`` reading
+        window_ns: Window length in nanoseconds
+        
+    Returns:
+        Estimated number of requests in the trailing window
+    """
+    index = now_ns // window_ns
+    if index != window[0]:
+        window[2] = window[1] if index == window[0] + 1 else 0
+        window[1] = 0
+        window[0] = index
+    elapsed = (now_ns % window_ns) / window_ns
+    return window[2] * (1 - elapsed) + window[1]
+
 class RateLimiter:
-    """Rate limiter using sliding window algorithm."""
+    """
+    Rate limiter using the token bucket algorithm.
+
+    Each client holds up to ``max_requests`` tokens, refilled lazily at
+    ``max_requests / window_seconds`` per second when it's next checked, so a
+    client's whole state is ``[tokens, last_update]``. Buckets are kept in
+    least-recently-checked order: one idle for a full window has refilled and
+    is dropped, since a fresh bucket is identical, and ``max_clients`` caps
+    the total so a flood of distinct IPs can't grow memory without bound.
+
+    No method awaits anything, so each check runs to completion on the event
+    loop without interleaving and needs no lock; one client's check never
+    waits behind another's.
+    """
     
-    def __init__(self, max_requests: int = 5, window_seconds: int = 60):
+    def __init__(self, max_requests: int = 5, window_seconds: int = 60, max_clients: int = 100_000):
         """
         Initialize rate limiter.
         
         Args:
             max_requests: Maximum number of requests allowed
             window_seconds: Time window in seconds
+            max_clients: Maximum number of client buckets kept
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: Dict[str, deque] = defaultdict(deque)
-        self._lock = asyncio.Lock()
+        self.max_clients = max_clients
+        self.rate = max_requests / window_seconds
+        # Least recently checked first; [tokens, last_update] per client, on the
+        # monotonic clock so a wall-clock adjustment can't drain or overfill buckets
+        self.buckets: OrderedDict[str, List[float]] = OrderedDict()
+        self._stats = {"allowed": 0, "denied": 0, "evicted": 0}
+    
+    def _refill(self, client_id: str) -> List[float]:
+        """Top up a client's bucket for the time since its last update."""
+        now = time.monotonic()
+        bucket = self.buckets.get(client_id)
+        if bucket is None:
+            bucket = self.buckets[client_id] = [float(self.max_requests), now]
+        else:
+            bucket[0] = min(self.max_requests, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            self.buckets.move_to_end(client_id)
+        self._evict_idle(now)
+        return bucket
+    
+    def _evict_idle(self, now: float) -> None:
+        """Drop buckets from the front that have sat idle a full window, or exceed ``max_clients``."""
+        evicted = 0
+        while self.buckets:
+            oldest = next(iter(self.buckets.values()))
+            if now - oldest[1] < self.window_seconds and len(self.buckets) <= self.max_clients:
+                break
+            self.buckets.popitem(last=False)
+            evicted += 1
+        self._stats["evicted"] += evicted
     
     async def is_allowed(self, client_id: str) -> bool:
         """
@@ -39,45 +102,54 @@ class RateLimiter:
         Returns:
             True if request is allowed, False otherwise
         """
-        async with self._lock:
-            now = time.time()
-            client_requests = self.requests[client_id]
-            
-            # Remove old requests outside the window
-            while client_requests and client_requests[0] <= now - self.window_seconds:
-                client_requests.popleft()
-            
-            # Check if we're under the limit
-            if len(client_requests) < self.max_requests:
-                client_requests.append(now)
-                logger.info(f"Rate limit check passed for {client_id}: {len(client_requests)}/{self.max_requests} requests")
-                return True
-            else:
-                logger.warning(f"Rate limit exceeded for {client_id}: {len(client_requests)}/{self.max_requests} requests")
-                return False
+        bucket = self._refill(client_id)
+        
+        # Check if we're under the limit
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            # Passes happen on every request, so they're counted rather than logged
+            self._stats["allowed"] += 1
+            return True
+        else:
+            self._stats["denied"] += 1
+            logger.warning("Rate limit exceeded for %s: %.1f/%d tokens left", client_id, bucket[0], self.max_requests)
+            return False
     
     async def get_remaining_requests(self, client_id: str) -> int:
         """Get remaining requests for client."""
-        async with self._lock:
-            now = time.time()
-            client_requests = self.requests[client_id]
-            
-            # Remove old requests
-            while client_requests and client_requests[0] <= now - self.window_seconds:
-                client_requests.popleft()
-            
-            return max(0, self.max_requests - len(client_requests))
+        # Lookups alone mustn't create buckets; an unknown client has a full one
+        if client_id not in self.buckets:
+            return self.max_requests
+        return int(self._refill(client_id)[0])
     
     async def get_reset_time(self, client_id: str) -> Optional[float]:
-        """Get time when rate limit resets for client."""
-        async with self._lock:
-            client_requests = self.requests[client_id]
-            if not client_requests:
-                return None
-            return client_requests[0] + self.window_seconds
+        """Get wall-clock time when the client next has a token, or None if its bucket is full."""
+        if client_id not in self.buckets:
+            return None
+        tokens = self._refill(client_id)[0]
+        if tokens >= self.max_requests:
+            return None
+        return time.time() + max(0.0, 1 - tokens) / self.rate
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics."""
+        return {
+            **self._stats,
+            "clients": len(self.buckets),
+            "max_clients": self.max_clients,
+            "max_requests": self.max_requests,
+            "window_seconds": self.window_seconds
+        }
 
 class GlobalRateLimiter:
-    """Global rate limiter for system-wide protection."""
+    """
+    Global rate limiter for system-wide protection.
+
+    A sliding window counter: the previous fixed window's count is weighted
+    by its overlap with the trailing window, so checks are O(1). Windows are
+    measured on the monotonic clock, immune to wall-clock adjustments.
+    Lock-free for the same reason as ``RateLimiter``.
+    """
     
     def __init__(self, max_requests: int = 50, window_seconds: int = 60):
         """
@@ -89,26 +161,31 @@ class GlobalRateLimiter:
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = deque()
-        self._lock = asyncio.Lock()
+        self.window_ns = window_seconds * 1_000_000_000
+        self.window: List[int] = [0, 0, 0]
+        self._stats = {"allowed": 0, "denied": 0}
     
     async def is_allowed(self) -> bool:
         """Check if global request is allowed."""
-        async with self._lock:
-            now = time.time()
-            
-            # Remove old requests
-            while self.requests and self.requests[0] <= now - self.window_seconds:
-                self.requests.popleft()
-            
-            # Check if we're under the limit
-            if len(self.requests) < self.max_requests:
-                self.requests.append(now)
-                logger.info(f"Global rate limit check passed: {len(self.requests)}/{self.max_requests} requests")
-                return True
-            else:
-                logger.warning(f"Global rate limit exceeded: {len(self.requests)}/{self.max_requests} requests")
-                return False
+        estimate = _advance_window(self.window, time.monotonic_ns(), self.window_ns)
+        
+        # Check if we're under the limit
+        if estimate + 1 <= self.max_requests:
+            self.window[1] += 1
+            self._stats["allowed"] += 1
+            return True
+        else:
+            self._stats["denied"] += 1
+            logger.warning("Global rate limit exceeded: %.1f/%d requests", estimate, self.max_requests)
+            return False
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get global rate limiter statistics."""
+        return {
+            **self._stats,
+            "max_requests": self.max_requests,
+            "window_seconds": self.window_seconds
+        }
 
 # Global instances
 client_rate_limiter = RateLimiter(max_requests=5, window_seconds=60)  # 5 requests per minute per client
@@ -5,7 +5,8 @@ Secrets management utility for secure credential handling.
 import os
 import boto3
 import json
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from botocore.exceptions import ClientError, NoCredentialsError
 from utils.logging_config import get_logger
 
@@ -121,6 +122,50 @@ class SecretsManager:
                 return os.getenv(fallback_env_var)
             return None
     
+    def get_parameters(self, parameters: List[Tuple[str, Optional[str]]]) -> Dict[str, Optional[str]]:
+        """
+        Retrieve several parameters from AWS SSM Parameter Store in batched calls.
+        
+        Args:
+            parameters: (parameter name, fallback environment variable) pairs
+            
+        Returns:
+            Dictionary of parameter names and values, None where neither source has one
+        """
+        fallbacks = dict(parameters)
+        values = {name: None for name in fallbacks}
+        
+        if self.ssm_client and fallbacks:
+            names = list(fallbacks)
+            # GetParameters accepts at most 10 names per call; boto3 clients are
+            # thread-safe, so the batches go out concurrently in one round trip
+            batches = [names[i:i + 10] for i in range(0, len(names), 10)]
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                for batch_values in executor.map(self._get_parameter_batch, batches):
+                    values.update(batch_values)
+        
+        # Fall back to environment variables for anything SSM didn't return
+        for name, fallback_env_var in fallbacks.items():
+            if values[name] is None and fallback_env_var:
+                values[name] = os.getenv(fallback_env_var)
+        
+        return values
+    
+    def _get_parameter_batch(self, names: List[str]) -> Dict[str, str]:
+        """Retrieve up to 10 parameters in one GetParameters call; empty on error."""
+        try:
+            response = self.ssm_client.get_parameters(Names=names, WithDecryption=True)
+        except ClientError as e:
+            logger.error(f"Error retrieving parameters {names}: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving parameters {names}: {e}")
+            return {}
+        
+        for name in response.get('InvalidParameters', []):
+            logger.warning(f"Parameter {name} not found in SSM Parameter Store")
+        return {parameter['Name']: parameter['Value'] for parameter in response['Parameters']}
+    
     def get_all_secrets(self, secret_prefix: str = "sentinelhire/") -> Dict[str, Any]:
         """
         Retrieve all secrets with a given prefix.
@@ -163,6 +208,39 @@ class SecretsManager:
             logger.error(f"Unexpected error listing secrets: {e}")
             return {}
 
+# Settings field -> (SSM parameter name, fallback environment variable)
+CONFIG_PARAMETERS = {
+    # AWS Configuration
+    'aws_access_key_id': ('/sentinelhire/aws/access_key_id', 'AWS_ACCESS_KEY_ID'),
+    'aws_secret_access_key': ('/sentinelhire/aws/secret_access_key', 'AWS_SECRET_ACCESS_KEY'),
+    'aws_region': ('/sentinelhire/aws/region', 'AWS_REGION'),
+    
+    # Supabase Configuration
+    'supabase_url': ('/sentinelhire/supabase/url', 'SUPABASE_URL'),
+    'supabase_key': ('/sentinelhire/supabase/key', 'SUPABASE_KEY'),
+    'supabase_service_role_key': ('/sentinelhire/supabase/service_role_key', 'SUPABASE_SERVICE_ROLE_KEY'),
+    
+    # External API Keys
+    'numverify_api_key': ('/sentinelhire/apis/numverify_key', 'NUMVERIFY_API_KEY'),
+    'abstract_api_key': ('/sentinelhire/apis/abstract_key', 'ABSTRACT_API_KEY'),
+    'serpapi_key': ('/sentinelhire/apis/serpapi_key', 'SERPAPI_KEY'),
+    
+    # Background Verification APIs
+    'college_scorecard_key': ('/sentinelhire/apis/college_scorecard_key', 'COLLEGE_SCORECARD_KEY'),
+    'github_token': ('/sentinelhire/apis/github_token', 'GITHUB_TOKEN'),
+    'sec_contact_email': ('/sentinelhire/apis/sec_contact_email', 'SEC_CONTACT_EMAIL'),
+    'openalex_contact_email': ('/sentinelhire/apis/openalex_contact_email', 'OPENALEX_CONTACT_EMAIL'),
+    
+    # Redis Configuration
+    'redis_url': ('/sentinelhire/redis/url', 'REDIS_URL'),
+    
+    # Application Settings
+    'debug': ('/sentinelhire/app/debug', 'DEBUG'),
+    'log_level': ('/sentinelhire/app/log_level', 'LOG_LEVEL'),
+    'rate_limit_per_minute': ('/sentinelhire/app/rate_limit_per_minute', 'RATE_LIMIT_PER_MINUTE'),
+    'max_file_size_mb': ('/sentinelhire/app/max_file_size_mb', 'MAX_FILE_SIZE_MB'),
+}
+
 def get_config_from_secrets() -> Dict[str, Any]:
     """
     Get configuration from AWS Secrets Manager with environment variable fallback.
@@ -171,92 +249,14 @@ def get_config_from_secrets() -> Dict[str, Any]:
         Configuration dictionary
     """
     secrets_manager = SecretsManager()
+    values = secrets_manager.get_parameters(list(CONFIG_PARAMETERS.values()))
+    config = {key: values[name] for key, (name, _) in CONFIG_PARAMETERS.items()}
     
-    config = {
-        # AWS Configuration
-        'aws_access_key_id': secrets_manager.get_parameter(
-            '/sentinelhire/aws/access_key_id',
-            'AWS_ACCESS_KEY_ID'
-        ),
-        'aws_secret_access_key': secrets_manager.get_parameter(
-            '/sentinelhire/aws/secret_access_key',
-            'AWS_SECRET_ACCESS_KEY'
-        ),
-        'aws_region': secrets_manager.get_parameter(
-            '/sentinelhire/aws/region',
-            'AWS_REGION'
-        ) or 'us-east-1',
-        
-        # Supabase Configuration
-        'supabase_url': secrets_manager.get_parameter(
-            '/sentinelhire/supabase/url',
-            'SUPABASE_URL'
-        ),
-        'supabase_key': secrets_manager.get_parameter(
-            '/sentinelhire/supabase/key',
-            'SUPABASE_KEY'
-        ),
-        'supabase_service_role_key': secrets_manager.get_parameter(
-            '/sentinelhire/supabase/service_role_key',
-            'SUPABASE_SERVICE_ROLE_KEY'
-        ),
-        
-        # External API Keys
-        'numverify_api_key': secrets_manager.get_parameter(
-            '/sentinelhire/apis/numverify_key',
-            'NUMVERIFY_API_KEY'
-        ),
-        'abstract_api_key': secrets_manager.get_parameter(
-            '/sentinelhire/apis/abstract_key',
-            'ABSTRACT_API_KEY'
-        ),
-        'serpapi_key': secrets_manager.get_parameter(
-            '/sentinelhire/apis/serpapi_key',
-            'SERPAPI_KEY'
-        ),
-        
-        # Background Verification APIs
-        'college_scorecard_key': secrets_manager.get_parameter(
-            '/sentinelhire/apis/college_scorecard_key',
-            'COLLEGE_SCORECARD_KEY'
-        ),
-        'github_token': secrets_manager.get_parameter(
-            '/sentinelhire/apis/github_token',
-            'GITHUB_TOKEN'
-        ),
-        'sec_contact_email': secrets_manager.get_parameter(
-            '/sentinelhire/apis/sec_contact_email',
-            'SEC_CONTACT_EMAIL'
-        ),
-        'openalex_contact_email': secrets_manager.get_parameter(
-            '/sentinelhire/apis/openalex_contact_email',
-            'OPENALEX_CONTACT_EMAIL'
-        ),
-        
-        # Redis Configuration
-        'redis_url': secrets_manager.get_parameter(
-            '/sentinelhire/redis/url',
-            'REDIS_URL'
-        ),
-        
-        # Application Settings
-        'debug': secrets_manager.get_parameter(
-            '/sentinelhire/app/debug',
-            'DEBUG'
-        ) == 'true',
-        'log_level': secrets_manager.get_parameter(
-            '/sentinelhire/app/log_level',
-            'LOG_LEVEL'
-        ) or 'INFO',
-        'rate_limit_per_minute': int(secrets_manager.get_parameter(
-            '/sentinelhire/app/rate_limit_per_minute',
-            'RATE_LIMIT_PER_MINUTE'
-        ) or '60'),
-        'max_file_size_mb': int(secrets_manager.get_parameter(
-            '/sentinelhire/app/max_file_size_mb',
-            'MAX_FILE_SIZE_MB'
-        ) or '10'),
-    }
+    config['aws_region'] = config['aws_region'] or 'us-east-1'
+    config['debug'] = config['debug'] == 'true'
+    config['log_level'] = config['log_level'] or 'INFO'
+    config['rate_limit_per_minute'] = int(config['rate_limit_per_minute'] or '60')
+    config['max_file_size_mb'] = int(config['max_file_size_mb'] or '10')
     
     # Filter out None values
     return {k: v for k, v in config.items() if v is not None}